@@ -1,24 +1,170 @@
 """Flask web application for Public Records search."""
 
 import os
-from flask import Flask, render_template, request, jsonify
+import re
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple
+from flask import Flask, Response, render_template, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
-from dotenv import load_dotenv
+from werkzeug.exceptions import HTTPException
 
-from src.public_record import PublicRecordClient
+from src.public_record import InvalidInputError, PublicRecordClient
+from src.public_record import jsonlib
+from src.public_record.client import (
+    UNCONFIGURED_RESPONSE,
+    resolve_record_types
+)
+from src.public_record.concurrency import fan_out, fan_out_as_completed
 
 # Load environment variables
-load_dotenv()
+PublicRecordClient.preload_env()
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """JSON provider that encodes and decodes with orjson when available."""
+    
+    def dumps(self, obj, **kwargs):
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        return jsonlib.dumps(obj, default=self.default).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return jsonlib.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        if self.compact is False or (self.compact is None and self._app.debug):
+            return super().response(obj)
+        return self._app.response_class(
+            jsonlib.dumps(obj, default=self.default),
+            mimetype=self.mimetype
+        )
+
 
 # Initialize Flask app
 app = Flask(__name__, 
             static_folder='static',
             template_folder='templates')
-CORS(app)
+app.json = FastJSONProvider(app)
+# Only the JSON API is called cross-origin; pages and static files skip CORS
+CORS(app, resources=r'/api/*')
 
 # Initialize Public Record Client
 client = PublicRecordClient(load_env=True)
 
+# Seconds a search request waits for upstream results
+SEARCH_TIMEOUT = float(os.environ.get('SEARCH_TIMEOUT', 30))
+
+# Constant responses, serialized once at startup
+STATIC_CACHE_CONTROL = 'public, max-age=60'
+_HEALTH_BODY = jsonlib.dumps({
+    'status': 'healthy',
+    'version': '1.0.0',
+    'service': 'Public Records API'
+})
+_TYPES_BODY = jsonlib.dumps({
+    'success': True,
+    'record_types': client.get_available_apis()
+})
+_STATUS_BODY = jsonlib.dumps({
+    'success': True,
+    'status': client.get_api_status()
+})
+
+# Path parameter validators, checked before any upstream work is done
+_IDENTIFIER_MATCH = re.compile(r'[\w.:-]{1,128}').fullmatch
+_DOMAIN_MATCH = re.compile(
+    r'(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z]{2,63}',
+    re.IGNORECASE
+).fullmatch
+
+VALIDATORS = {
+    'identifier': _IDENTIFIER_MATCH,
+    'domain': _DOMAIN_MATCH,
+}
+
+
+class SearchRequest(NamedTuple):
+    """Body of POST /api/search."""
+    query: str = ''
+    record_types: List[str] = ('all',)
+    filters: Dict[str, Any] = MappingProxyType({})
+
+
+class TypedSearchRequest(NamedTuple):
+    """Body of POST /api/search/<record_type>."""
+    query: str = ''
+    filters: Dict[str, Any] = MappingProxyType({})
+
+
+class AddressRequest(NamedTuple):
+    """Body of POST /api/property/address."""
+    address: str = ''
+    city: str = ''
+    state: str = ''
+
+
+class ValuationRequest(NamedTuple):
+    """Body of POST /api/property/valuation."""
+    address: str = ''
+    city: str = ''
+    state: str = ''
+    zipCode: str = ''
+
+
+def parse_body(schema):
+    """Decode the JSON request body into a request schema.
+    
+    Fields missing from the body take the schema defaults, which are shared
+    by every request and so must be immutable; unknown fields are ignored.
+    
+    Args:
+        schema: NamedTuple class describing the expected fields
+        
+    Returns:
+        Instance of schema
+        
+    Raises:
+        InvalidInputError: If the body is not a JSON object or a field has the
+            wrong type
+    """
+    data = request.get_json(silent=True)
+    if not isinstance(data, dict):
+        raise InvalidInputError('Request body must be a JSON object')
+    
+    values = {}
+    for field, annotation in schema.__annotations__.items():
+        if field not in data:
+            continue
+        value = data[field]
+        expected = getattr(annotation, '__origin__', annotation)
+        if not isinstance(value, expected) or (
+            expected is list and not all(isinstance(item, str) for item in value)
+        ):
+            raise InvalidInputError(f"Invalid type for field '{field}'")
+        values[field] = value
+    
+    return schema(**values)
+
+
+@app.errorhandler(InvalidInputError)
+def handle_invalid_input(e):
+    """Report invalid input as a JSON 400 response."""
+    return jsonify({'success': False, 'error': str(e)}), 400
+
+
+@app.errorhandler(Exception)
+def handle_exception(e):
+    """Report unexpected failures as a JSON 500 response."""
+    if isinstance(e, HTTPException):
+        return e
+    app.logger.exception('Unhandled error')
+    return jsonify({'success': False, 'error': 'Internal server error'}), 500
+
 
 @app.route('/')
 def index():
@@ -36,39 +182,81 @@ def search():
         "record_types": ["court", "property", "business", "government", "background", "vehicle"],
         "filters": {optional filters}
     }
+    
+    With ?stream=true the response is newline-delimited JSON with one
+    {"record_type": ..., "result": ...} line per record type, written as
+    soon as each search completes.
     """
-    try:
-        data = request.get_json()
-        query = data.get('query', '')
-        record_types = data.get('record_types', ['all'])
-        filters = data.get('filters', {})
-        
-        if not query:
-            return jsonify({'error': 'Query parameter is required'}), 400
-        
-        results = {}
-        
-        # Search all record types if 'all' is specified
-        if 'all' in record_types:
-            results = client.search_all(query, **filters)
-        else:
-            # Search specific record types
-            for record_type in record_types:
-                try:
-                    results[record_type] = client.search_by_type(
-                        record_type, query, **filters
-                    )
-                except Exception as e:
-                    results[record_type] = {'error': str(e)}
+    query, record_types, filters = parse_body(SearchRequest)
+    
+    if not query:
+        return jsonify({'error': 'Query parameter is required'}), 400
+    
+    if not record_types:
+        return jsonify({'error': 'At least one record type is required'}), 400
+    
+    search_everything = any(name.lower() == 'all' for name in record_types)
+    record_types = resolve_record_types(record_types)
+    
+    if request.args.get('stream', '').lower() == 'true':
+        skipped = ()
+        if search_everything:
+            status = client.get_api_status()
+            skipped = [name for name in record_types if not status[name]]
+            record_types = [name for name in record_types if status[name]]
+        return Response(
+            stream_search(query, record_types, filters, skipped),
+            mimetype='application/x-ndjson'
+        )
+    
+    # Search all record types if 'all' is specified
+    if search_everything:
+        results = client.search_all(query, filters, timeout=SEARCH_TIMEOUT)
+    else:
+        results = fan_out(search_calls(query, record_types, filters), SEARCH_TIMEOUT)
+    
+    return jsonify({
+        'success': True,
+        'query': query,
+        'results': results
+    })
+
+
+def stream_search(query, record_types, filters, skipped=()):
+    """Search record types concurrently, yielding NDJSON lines as they finish.
+    
+    Args:
+        query: Search query
+        record_types: Record types to search
+        filters: Additional search parameters
+        skipped: Unconfigured record types, reported without being searched
         
-        return jsonify({
-            'success': True,
-            'query': query,
-            'results': results
-        })
+    Yields:
+        One encoded JSON line per record type
+    """
+    for record_type in skipped:
+        yield jsonlib.dumps({'record_type': record_type, 'result': UNCONFIGURED_RESPONSE}) + b'\n'
     
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    calls = search_calls(query, record_types, filters)
+    for record_type, result in fan_out_as_completed(calls, SEARCH_TIMEOUT):
+        yield jsonlib.dumps({'record_type': record_type, 'result': result}) + b'\n'
+
+
+def search_calls(query, record_types, filters):
+    """Build one search_by_type call per record type for fan_out.
+    
+    Args:
+        query: Search query
+        record_types: Record types to search
+        filters: Additional search parameters
+        
+    Returns:
+        Dictionary mapping each record type to a zero-argument call
+    """
+    return {
+        record_type: partial(client.search_by_type, record_type, query, **filters)
+        for record_type in record_types
+    }
 
 
 @app.route('/api/search/<record_type>', methods=['POST'])
@@ -84,27 +272,19 @@ def search_by_type(record_type):
         "filters": {optional filters}
     }
     """
-    try:
-        data = request.get_json()
-        query = data.get('query', '')
-        filters = data.get('filters', {})
-        
-        if not query:
-            return jsonify({'error': 'Query parameter is required'}), 400
-        
-        result = client.search_by_type(record_type, query, **filters)
-        
-        return jsonify({
-            'success': True,
-            'record_type': record_type,
-            'query': query,
-            'result': result
-        })
+    query, filters = parse_body(TypedSearchRequest)
     
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    if not query:
+        return jsonify({'error': 'Query parameter is required'}), 400
+    
+    result = client.search_by_type(record_type, query, **filters)
+    
+    return jsonify({
+        'success': True,
+        'record_type': record_type,
+        'query': query,
+        'result': result
+    })
 
 
 @app.route('/api/record/<record_type>/<record_id>', methods=['GET'])
@@ -115,109 +295,127 @@ def get_record(record_type, record_id):
         record_type: Type of record
         record_id: Record identifier
     """
-    try:
-        result = client.get_record_by_type(record_type, record_id)
-        
-        return jsonify({
-            'success': True,
-            'record_type': record_type,
-            'record_id': record_id,
-            'result': result
-        })
+    if not VALIDATORS['identifier'](record_id):
+        return jsonify({'success': False, 'error': 'Invalid record ID'}), 400
     
-    except ValueError as e:
-        return jsonify({'success': False, 'error': str(e)}), 400
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+    result = client.get_record_by_type(record_type, record_id)
+    
+    return jsonify({
+        'success': True,
+        'record_type': record_type,
+        'record_id': record_id,
+        'result': result
+    })
 
 
 @app.route('/api/types', methods=['GET'])
 def get_record_types():
     """Get available record types."""
-    return jsonify({
-        'success': True,
-        'record_types': client.get_available_apis()
-    })
+    return Response(
+        _TYPES_BODY,
+        mimetype='application/json',
+        headers={'Cache-Control': STATIC_CACHE_CONTROL}
+    )
 
 
 @app.route('/api/status', methods=['GET'])
 def get_api_status():
     """Get API configuration status."""
-    return jsonify({
-        'success': True,
-        'status': client.get_api_status()
-    })
+    return Response(
+        _STATUS_BODY,
+        mimetype='application/json',
+        headers={'Cache-Control': STATIC_CACHE_CONTROL}
+    )
 
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint."""
-    return jsonify({
-        'status': 'healthy',
-        'version': '1.0.0',
-        'service': 'Public Records API'
-    })
-
-
-# Court Records specific endpoints
-@app.route('/api/court/case/<case_id>', methods=['GET'])
-def get_court_case(case_id):
-    """Get court case details."""
-    result = client.court_records.get_record(case_id)
-    return jsonify({'success': True, 'result': result})
-
-
-@app.route('/api/court/documents/<case_id>', methods=['GET'])
-def get_case_documents(case_id):
-    """Get documents for a court case."""
-    result = client.court_records.get_case_documents(case_id)
-    return jsonify({'success': True, 'result': result})
+    return Response(
+        _HEALTH_BODY,
+        mimetype='application/json',
+        headers={'Cache-Control': STATIC_CACHE_CONTROL}
+    )
 
 
 # Property Records specific endpoints
 @app.route('/api/property/address', methods=['POST'])
 def search_property_by_address():
     """Search property by address."""
-    data = request.get_json()
-    address = data.get('address', '')
-    city = data.get('city', '')
-    state = data.get('state', '')
+    body = parse_body(AddressRequest)
     
-    result = client.property_records.get_by_address(address, city, state)
+    result = client.property_records.get_by_address(body.address, body.city, body.state)
     return jsonify({'success': True, 'result': result})
 
 
 @app.route('/api/property/valuation', methods=['POST'])
 def get_property_valuation():
     """Get property valuation."""
-    data = request.get_json()
-    address = data.get('address', '')
+    body = parse_body(ValuationRequest)
     
-    result = client.property_records.get_rentcast_valuation(address, **data)
-    return jsonify({'success': True, 'result': result})
-
-
-# Business Records specific endpoints
-@app.route('/api/business/enrich/<domain>', methods=['GET'])
-def enrich_company(domain):
-    """Enrich company data from domain."""
-    result = client.business_registration.enrich_company(domain)
-    return jsonify({'success': True, 'result': result})
-
-
-# Vehicle Records specific endpoints
-@app.route('/api/vehicle/decode/<vin>', methods=['GET'])
-def decode_vin(vin):
-    """Decode VIN."""
-    result = client.vehicle_records.decode_vin(vin)
+    options = {field: value for field, value in body._asdict().items() if value}
+    options.pop('address', None)
+    
+    result = client.property_records.get_rentcast_valuation(body.address, **options)
     return jsonify({'success': True, 'result': result})
 
 
-@app.route('/api/vehicle/history/<vin>', methods=['GET'])
-def get_vehicle_history(vin):
-    """Get vehicle history."""
-    result = client.vehicle_records.get_vehicle_history(vin)
-    return jsonify({'success': True, 'result': result})
+# Single-identifier lookup endpoints:
+# (route, endpoint, client method, validator name, description).
+# VINs have no validator here: the vehicle client validates them itself and
+# raises InvalidInputError, which is reported as a 400.
+LOOKUP_ENDPOINTS = [
+    ('/api/court/case/<value>', 'get_court_case',
+     'court_records.get_record', 'identifier', 'Get court case details.'),
+    ('/api/court/documents/<value>', 'get_case_documents',
+     'court_records.get_case_documents', 'identifier', 'Get documents for a court case.'),
+    ('/api/business/enrich/<value>', 'enrich_company',
+     'business_registration.enrich_company', 'domain', 'Enrich company data from domain.'),
+    ('/api/vehicle/decode/<value>', 'decode_vin',
+     'vehicle_records.decode_vin', None, 'Decode VIN.'),
+    ('/api/vehicle/history/<value>', 'get_vehicle_history',
+     'vehicle_records.get_vehicle_history', None, 'Get vehicle history.'),
+]
+
+
+def _make_lookup_handler(endpoint, method_path, validator, description):
+    """Build a view function that calls a single-argument client method.
+    
+    Lookups are cached by the client itself, keyed on the normalized value.
+    
+    Args:
+        endpoint: Flask endpoint name
+        method_path: Dotted '<api>.<method>' path on the client
+        validator: Key into VALIDATORS, or None if the client method
+            validates its own input; rejected values get a 400 response
+        description: Docstring for the generated view
+        
+    Returns:
+        View function
+    """
+    api_name, method_name = method_path.split('.')
+    is_valid = VALIDATORS[validator] if validator else None
+    error = {'success': False, 'error': f'Invalid {validator}'}
+    
+    def handler(value):
+        if is_valid is not None and not is_valid(value):
+            return jsonify(error), 400
+        
+        method = getattr(getattr(client, api_name), method_name)
+        return jsonify({'success': True, 'result': method(value)})
+    
+    handler.__name__ = endpoint
+    handler.__doc__ = description
+    return handler
+
+
+for _route, _endpoint, _method_path, _validator, _description in LOOKUP_ENDPOINTS:
+    app.add_url_rule(
+        _route,
+        endpoint=_endpoint,
+        view_func=_make_lookup_handler(_endpoint, _method_path, _validator, _description),
+        methods=['GET']
+    )
 
 
 if __name__ == '__main__':
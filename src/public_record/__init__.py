@@ -7,6 +7,7 @@ background checks, and vehicle records.
 
 __version__ = "1.0.0"
 
+from .base import InvalidInputError
 from .client import PublicRecordClient
 from .apis import (
     CourtRecordsAPI,
@@ -18,6 +19,7 @@ from .apis import (
 )
 
 __all__ = [
+    'InvalidInputError',
     'PublicRecordClient',
     'CourtRecordsAPI',
     'PropertyRecordsAPI',
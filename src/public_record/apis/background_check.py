@@ -1,7 +1,87 @@
 """Background Check API client."""
 
 from typing import Dict, Any, Optional, List
-from ..base import BaseAPIClient
+import requests
+from ..base import BaseAPIClient, MOCK_MESSAGE, requires_key
+
+
+_API_TYPE = 'background_check'
+
+_SEARCH_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'available_checks': (
+        'criminal_records',
+        'employment_verification',
+        'education_verification',
+        'motor_vehicle_records',
+        'sex_offender_registry',
+        'global_watchlist'
+    ),
+    'message': MOCK_MESSAGE
+}
+
+_RECORD_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'message': MOCK_MESSAGE
+}
+
+_CHECKR_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'checkr',
+    'message': 'Checkr API key required. Visit https://checkr.com for access.'
+}
+
+_CHECKR_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'checkr',
+    'base_url': 'https://api.checkr.com/v1',
+    'available_screenings': (
+        'criminal_background',
+        'continuous_monitoring',
+        'motor_vehicle_records',
+        'employment_verification',
+        'education_verification',
+        'international_checks',
+        'sex_offender_registry'
+    ),
+    'features': (
+        'branded_candidate_portal',
+        'webhook_notifications',
+        'customizable_packages',
+        'compliance_ready'
+    ),
+    'message': 'Mock implementation. Configure API key to use real Checkr API.'
+}
+
+_IDENFY_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'idenfy',
+    'message': 'iDenfy API key required. Visit https://www.idenfy.com for access.'
+}
+
+_IDENFY_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'idenfy',
+    'coverage': 'All U.S. states and jurisdictions',
+    'includes': (
+        'court_records',
+        'arrest_warrants',
+        'blacklist_databases',
+        'watchlists',
+        'adverse_media'
+    ),
+    'response_time': 'Seconds',
+    'message': 'Mock implementation. Configure API key to use real iDenfy API.'
+}
+
+_MONITORING_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'monitoring_types': (
+        'continuous_criminal_monitoring',
+        'continuous_mvr'
+    ),
+    'message': MOCK_MESSAGE
+}
 
 
 class BackgroundCheckAPI(BaseAPIClient):
@@ -14,12 +94,26 @@ class BackgroundCheckAPI(BaseAPIClient):
     - Verified Credentials: Background verification services
     """
     
+    __slots__ = (
+        'api_type',
+        'checkr_key',
+        'gridlines_key',
+        'idenfy_key'
+    )
+    
+    # Criminal-record and identity data must not outlive the request
+    CACHE_TTL = 0
+    
+    gridlines_base_url = "https://api.gridlines.io"
+    idenfy_base_url = "https://ivs.idenfy.com/api/v2"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         checkr_key: Optional[str] = None,
         gridlines_key: Optional[str] = None,
-        idenfy_key: Optional[str] = None
+        idenfy_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """Initialize Background Check API client.
         
@@ -28,14 +122,13 @@ class BackgroundCheckAPI(BaseAPIClient):
             checkr_key: Checkr API key
             gridlines_key: Gridlines API key
             idenfy_key: iDenfy API key
+            session: Shared requests session (optional)
         """
-        super().__init__(api_key=api_key, base_url="https://api.checkr.com/v1")
-        self.api_type = "background_check"
+        super().__init__(api_key=api_key, base_url="https://api.checkr.com/v1", session=session)
+        self.api_type = _API_TYPE
         self.checkr_key = checkr_key
         self.gridlines_key = gridlines_key
-        self.gridlines_base_url = "https://api.gridlines.io"
         self.idenfy_key = idenfy_key
-        self.idenfy_base_url = "https://ivs.idenfy.com/api/v2"
     
     def search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search background check records.
@@ -47,20 +140,7 @@ class BackgroundCheckAPI(BaseAPIClient):
         Returns:
             Dictionary containing search results
         """
-        return {
-            'api_type': self.api_type,
-            'query': query,
-            'filters': kwargs,
-            'available_checks': [
-                'criminal_records',
-                'employment_verification',
-                'education_verification',
-                'motor_vehicle_records',
-                'sex_offender_registry',
-                'global_watchlist'
-            ],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_SEARCH_TEMPLATE, 'query': query, 'filters': kwargs}
     
     def get_record(self, record_id: str) -> Dict[str, Any]:
         """Get background check report.
@@ -71,13 +151,9 @@ class BackgroundCheckAPI(BaseAPIClient):
         Returns:
             Dictionary containing background check details
         """
-        return {
-            'api_type': self.api_type,
-            'record_id': record_id,
-            'details': {},
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'record_id': record_id, 'details': {}}
     
+    @requires_key('checkr_key', _CHECKR_KEY_REQUIRED)
     def create_checkr_screening(
         self,
         candidate_email: str,
@@ -96,37 +172,9 @@ class BackgroundCheckAPI(BaseAPIClient):
         Returns:
             Dictionary containing screening ID and status
         """
-        if not self.checkr_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'checkr',
-                'message': 'Checkr API key required. Visit https://checkr.com for access.'
-            }
-        
-        return {
-            'api_type': self.api_type,
-            'source': 'checkr',
-            'candidate_email': candidate_email,
-            'package': package,
-            'base_url': 'https://api.checkr.com/v1',
-            'available_screenings': [
-                'criminal_background',
-                'continuous_monitoring',
-                'motor_vehicle_records',
-                'employment_verification',
-                'education_verification',
-                'international_checks',
-                'sex_offender_registry'
-            ],
-            'features': [
-                'branded_candidate_portal',
-                'webhook_notifications',
-                'customizable_packages',
-                'compliance_ready'
-            ],
-            'message': 'Mock implementation. Configure API key to use real Checkr API.'
-        }
+        return {**_CHECKR_TEMPLATE, 'candidate_email': candidate_email, 'package': package}
     
+    @requires_key('idenfy_key', _IDENFY_KEY_REQUIRED)
     def search_criminal_records(
         self,
         name: str,
@@ -145,30 +193,12 @@ class BackgroundCheckAPI(BaseAPIClient):
         Returns:
             Dictionary containing criminal record results
         """
-        if not self.idenfy_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'idenfy',
-                'message': 'iDenfy API key required. Visit https://www.idenfy.com for access.'
-            }
-        
         return {
-            'api_type': self.api_type,
-            'source': 'idenfy',
+            **_IDENFY_TEMPLATE,
             'name': name,
             'dob': dob,
             'location': location,
-            'base_url': self.idenfy_base_url,
-            'coverage': 'All U.S. states and jurisdictions',
-            'includes': [
-                'court_records',
-                'arrest_warrants',
-                'blacklist_databases',
-                'watchlists',
-                'adverse_media'
-            ],
-            'response_time': 'Seconds',
-            'message': 'Mock implementation. Configure API key to use real iDenfy API.'
+            'base_url': self.idenfy_base_url
         }
     
     def get_continuous_monitoring(self, candidate_id: str) -> Dict[str, Any]:
@@ -180,12 +210,4 @@ class BackgroundCheckAPI(BaseAPIClient):
         Returns:
             Dictionary containing monitoring updates
         """
-        return {
-            'api_type': self.api_type,
-            'candidate_id': candidate_id,
-            'monitoring_types': [
-                'continuous_criminal_monitoring',
-                'continuous_mvr'
-            ],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_MONITORING_TEMPLATE, 'candidate_id': candidate_id}
@@ -1,7 +1,63 @@
 """Business Registration API client."""
 
-from typing import Dict, Any, Optional
-from ..base import BaseAPIClient
+from typing import Dict, Any, Iterable, Optional
+import requests
+from ..base import BaseAPIClient, MOCK_MESSAGE, requires_key
+from ..cache import cached_method
+from ..concurrency import fan_out
+
+
+_API_TYPE = 'business_registration'
+
+_SEARCH_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'total': 0,
+    'message': MOCK_MESSAGE
+}
+
+_RECORD_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'message': MOCK_MESSAGE
+}
+
+_OPENCORPORATES_DATA_AVAILABLE = (
+    'company_name',
+    'company_number',
+    'jurisdiction',
+    'incorporation_date',
+    'company_type',
+    'registered_address',
+    'officers_directors',
+    'filing_history'
+)
+
+_COMPANIES_API_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'companies_api',
+    'message': 'The Companies API key required. Visit https://www.thecompaniesapi.com'
+}
+
+_COMPANIES_API_FEATURES = (
+    'company_enrichment',
+    'natural_language_search',
+    'industry_filtering',
+    'location_search',
+    'employee_count_ranges'
+)
+
+_CORESIGNAL_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'coresignal',
+    'message': 'Coresignal API key required. Visit https://coresignal.com'
+}
+
+_CORESIGNAL_FEATURES = (
+    'real_time_data',
+    'multi_source_aggregation',
+    'ai_enriched_fields',
+    'growth_metrics',
+    'employee_change_events'
+)
 
 
 class BusinessRegistrationAPI(BaseAPIClient):
@@ -14,12 +70,23 @@ class BusinessRegistrationAPI(BaseAPIClient):
     - Moody's: Entity verification from 200+ jurisdictions
     """
     
+    __slots__ = (
+        'api_type',
+        'opencorporates_key',
+        'coresignal_key',
+        'companies_api_key'
+    )
+    
+    coresignal_base_url = "https://api.coresignal.com"
+    companies_base_url = "https://api.thecompaniesapi.com"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         opencorporates_key: Optional[str] = None,
         coresignal_key: Optional[str] = None,
-        companies_api_key: Optional[str] = None
+        companies_api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """Initialize Business Registration API client.
         
@@ -28,14 +95,13 @@ class BusinessRegistrationAPI(BaseAPIClient):
             opencorporates_key: OpenCorporates API key
             coresignal_key: Coresignal API key
             companies_api_key: The Companies API key
+            session: Shared requests session (optional)
         """
-        super().__init__(api_key=api_key, base_url="https://api.opencorporates.com")
-        self.api_type = "business_registration"
+        super().__init__(api_key=api_key, base_url="https://api.opencorporates.com", session=session)
+        self.api_type = _API_TYPE
         self.opencorporates_key = opencorporates_key
         self.coresignal_key = coresignal_key
-        self.coresignal_base_url = "https://api.coresignal.com"
         self.companies_api_key = companies_api_key
-        self.companies_base_url = "https://api.thecompaniesapi.com"
     
     def search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search for business registrations.
@@ -56,15 +122,44 @@ class BusinessRegistrationAPI(BaseAPIClient):
                 'page': current page
             }
         """
+        return {**_SEARCH_TEMPLATE, 'query': query, 'filters': kwargs, 'results': []}
+    
+    def search_sources(
+        self,
+        query: str,
+        domain: Optional[str] = None,
+        jurisdiction: Optional[str] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
+        """Search every business data provider concurrently.
+        
+        OpenCorporates and Coresignal are queried in parallel, along with
+        The Companies API when a domain is given, so the call takes as long
+        as the slowest provider rather than the sum of all of them.
+        
+        Args:
+            query: Company name to search
+            domain: Optional company domain for enrichment
+            jurisdiction: Optional OpenCorporates jurisdiction code
+            **kwargs: Additional Coresignal filters
+            
+        Returns:
+            Dictionary containing one result per provider under 'sources'
+        """
+        calls = {
+            'opencorporates': lambda: self.search_opencorporates(query, jurisdiction),
+            'coresignal': lambda: self.search_coresignal(query, **kwargs)
+        }
+        if domain:
+            calls['companies_api'] = lambda: self.enrich_company(domain)
+        
         return {
             'api_type': self.api_type,
             'query': query,
-            'filters': kwargs,
-            'results': [],
-            'total': 0,
-            'message': 'Mock implementation. Configure API key to use real data.'
+            'sources': fan_out(calls)
         }
     
+    @cached_method
     def get_record(self, business_id: str) -> Dict[str, Any]:
         """Get details for a specific business registration.
         
@@ -82,13 +177,28 @@ class BusinessRegistrationAPI(BaseAPIClient):
             - Officers/Directors
             - Status
         """
-        return {
-            'api_type': self.api_type,
-            'business_id': business_id,
-            'details': {},
-            'message': 'Mock implementation. Configure API key to use real data.'
+        return {**_RECORD_TEMPLATE, 'business_id': business_id, 'details': {}}
+    
+    def bulk_enrich(self, business_ids: Iterable[str]) -> Dict[str, Any]:
+        """Get details for many businesses.
+        
+        Each distinct ID is looked up once through get_record, so repeated
+        IDs and IDs fetched recently are served from the lookup cache.
+        
+        Args:
+            business_ids: Business registration identifiers
+            
+        Returns:
+            Dictionary containing records keyed by business ID, in input order
+        """
+        records = {
+            business_id: self.get_record(business_id)
+            for business_id in dict.fromkeys(business_ids)
         }
+        
+        return {**_RECORD_TEMPLATE, 'total': len(records), 'records': records}
     
+    @cached_method
     def get_by_ein(self, ein: str) -> Dict[str, Any]:
         """Get business information by EIN (Employer Identification Number).
         
@@ -98,13 +208,9 @@ class BusinessRegistrationAPI(BaseAPIClient):
         Returns:
             Dictionary containing business information
         """
-        return {
-            'api_type': self.api_type,
-            'ein': ein,
-            'details': {},
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'ein': ein, 'details': {}}
     
+    @cached_method
     def get_filings(self, business_id: str) -> Dict[str, Any]:
         """Get corporate filings for a business.
         
@@ -114,13 +220,9 @@ class BusinessRegistrationAPI(BaseAPIClient):
         Returns:
             Dictionary containing list of filings (annual reports, amendments, etc.)
         """
-        return {
-            'api_type': self.api_type,
-            'business_id': business_id,
-            'filings': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'business_id': business_id, 'filings': []}
     
+    @cached_method
     def get_licenses(self, business_id: str) -> Dict[str, Any]:
         """Get professional licenses associated with a business.
         
@@ -130,12 +232,7 @@ class BusinessRegistrationAPI(BaseAPIClient):
         Returns:
             Dictionary containing list of licenses
         """
-        return {
-            'api_type': self.api_type,
-            'business_id': business_id,
-            'licenses': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'business_id': business_id, 'licenses': []}
     
     def search_opencorporates(self, company_name: str, jurisdiction: Optional[str] = None) -> Dict[str, Any]:
         """Search OpenCorporates database.
@@ -155,16 +252,7 @@ class BusinessRegistrationAPI(BaseAPIClient):
             'company_name': company_name,
             'jurisdiction': jurisdiction,
             'base_url': 'https://api.opencorporates.com/v0.4',
-            'data_available': [
-                'company_name',
-                'company_number',
-                'jurisdiction',
-                'incorporation_date',
-                'company_type',
-                'registered_address',
-                'officers_directors',
-                'filing_history'
-            ],
+            'data_available': _OPENCORPORATES_DATA_AVAILABLE,
             'license': 'CC BY-SA 3.0 or commercial',
             'message': 'Mock implementation. OpenCorporates provides both free and commercial access.'
         }
@@ -180,13 +268,12 @@ class BusinessRegistrationAPI(BaseAPIClient):
         Returns:
             Dictionary containing enriched company data
         """
-        if not self.companies_api_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'companies_api',
-                'message': 'The Companies API key required. Visit https://www.thecompaniesapi.com'
-            }
-        
+        return self._enrich_company(domain.lower())
+    
+    @cached_method
+    @requires_key('companies_api_key', _COMPANIES_API_KEY_REQUIRED)
+    def _enrich_company(self, domain: str) -> Dict[str, Any]:
+        """Enrich company data for a lower-cased domain."""
         return {
             'api_type': self.api_type,
             'source': 'companies_api',
@@ -194,16 +281,11 @@ class BusinessRegistrationAPI(BaseAPIClient):
             'base_url': self.companies_base_url,
             'data_points': '300+',
             'database_size': '50M+ companies',
-            'features': [
-                'company_enrichment',
-                'natural_language_search',
-                'industry_filtering',
-                'location_search',
-                'employee_count_ranges'
-            ],
+            'features': _COMPANIES_API_FEATURES,
             'message': 'Mock implementation. Configure API key to use real Companies API.'
         }
     
+    @requires_key('coresignal_key', _CORESIGNAL_KEY_REQUIRED)
     def search_coresignal(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search Coresignal company database.
         
@@ -216,13 +298,6 @@ class BusinessRegistrationAPI(BaseAPIClient):
         Returns:
             Dictionary containing company search results
         """
-        if not self.coresignal_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'coresignal',
-                'message': 'Coresignal API key required. Visit https://coresignal.com'
-            }
-        
         return {
             'api_type': self.api_type,
             'source': 'coresignal',
@@ -232,12 +307,6 @@ class BusinessRegistrationAPI(BaseAPIClient):
             'database_size': '70M+ companies',
             'data_fields': '300+',
             'avg_response_time': '176ms',
-            'features': [
-                'real_time_data',
-                'multi_source_aggregation',
-                'ai_enriched_fields',
-                'growth_metrics',
-                'employee_change_events'
-            ],
+            'features': _CORESIGNAL_FEATURES,
             'message': 'Mock implementation. Configure API key to use real Coresignal API.'
         }
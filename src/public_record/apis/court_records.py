@@ -1,7 +1,51 @@
 """Court Records API client."""
 
 from typing import Dict, Any, Optional
-from ..base import BaseAPIClient
+import requests
+from ..base import BaseAPIClient, MOCK_MESSAGE, requires_key
+from ..cache import cached_method
+
+
+_API_TYPE = 'court_records'
+
+_SEARCH_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'total': 0,
+    'message': MOCK_MESSAGE
+}
+
+_RECORD_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'message': MOCK_MESSAGE
+}
+
+_COURTLISTENER_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'courtlistener',
+    'message': 'CourtListener API token required. Get free token at https://www.courtlistener.com/help/api/'
+}
+
+_COURTLISTENER_ENDPOINTS = {
+    'dockets': '/dockets/',
+    'opinions': '/opinions/',
+    'parties': '/parties/',
+    'attorneys': '/attorneys/'
+}
+
+_LEGISCAN_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'legiscan',
+    'message': 'LegiScan API key required. Sign up at https://legiscan.com/legiscan'
+}
+
+_LEGISCAN_DATA_AVAILABLE = (
+    'bill_text',
+    'bill_status',
+    'sponsors',
+    'votes',
+    'amendments',
+    'committee_info'
+)
 
 
 class CourtRecordsAPI(BaseAPIClient):
@@ -14,13 +58,25 @@ class CourtRecordsAPI(BaseAPIClient):
     - UniCourt: Court data APIs
     """
     
+    __slots__ = (
+        'api_type',
+        'pacer_username',
+        'pacer_password',
+        'courtlistener_token',
+        'legiscan_key'
+    )
+    
+    courtlistener_base_url = "https://www.courtlistener.com/api/rest/v3"
+    legiscan_base_url = "https://api.legiscan.com"
+    
     def __init__(
         self, 
         api_key: Optional[str] = None,
         pacer_username: Optional[str] = None,
         pacer_password: Optional[str] = None,
         courtlistener_token: Optional[str] = None,
-        legiscan_key: Optional[str] = None
+        legiscan_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """Initialize Court Records API client.
         
@@ -30,15 +86,14 @@ class CourtRecordsAPI(BaseAPIClient):
             pacer_password: PACER account password
             courtlistener_token: CourtListener API token
             legiscan_key: LegiScan API key
+            session: Shared requests session (optional)
         """
-        super().__init__(api_key=api_key, base_url="https://api.unicourt.com")
-        self.api_type = "court_records"
+        super().__init__(api_key=api_key, base_url="https://api.unicourt.com", session=session)
+        self.api_type = _API_TYPE
         self.pacer_username = pacer_username
         self.pacer_password = pacer_password
         self.courtlistener_token = courtlistener_token
-        self.courtlistener_base_url = "https://www.courtlistener.com/api/rest/v3"
         self.legiscan_key = legiscan_key
-        self.legiscan_base_url = "https://api.legiscan.com"
     
     def search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search for court records.
@@ -62,15 +117,9 @@ class CourtRecordsAPI(BaseAPIClient):
             }
         """
         # Mock implementation - in production this would call the actual API
-        return {
-            'api_type': self.api_type,
-            'query': query,
-            'filters': kwargs,
-            'results': [],
-            'total': 0,
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_SEARCH_TEMPLATE, 'query': query, 'filters': kwargs, 'results': []}
     
+    @cached_method
     def get_record(self, case_id: str) -> Dict[str, Any]:
         """Get details for a specific court case.
         
@@ -86,13 +135,9 @@ class CourtRecordsAPI(BaseAPIClient):
             - Status
             - Documents
         """
-        return {
-            'api_type': self.api_type,
-            'case_id': case_id,
-            'details': {},
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'case_id': case_id, 'details': {}}
     
+    @cached_method
     def get_case_documents(self, case_id: str) -> Dict[str, Any]:
         """Get documents for a specific case.
         
@@ -102,12 +147,7 @@ class CourtRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing list of case documents
         """
-        return {
-            'api_type': self.api_type,
-            'case_id': case_id,
-            'documents': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'case_id': case_id, 'documents': []}
     
     def search_by_party(self, party_name: str, **kwargs) -> Dict[str, Any]:
         """Search for cases by party name.
@@ -121,6 +161,7 @@ class CourtRecordsAPI(BaseAPIClient):
         """
         return self.search(query=party_name, search_type='party', **kwargs)
     
+    @requires_key('courtlistener_token', _COURTLISTENER_KEY_REQUIRED)
     def search_courtlistener(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search CourtListener RECAP Archive.
         
@@ -136,28 +177,17 @@ class CourtRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing search results from CourtListener
         """
-        if not self.courtlistener_token:
-            return {
-                'api_type': self.api_type,
-                'source': 'courtlistener',
-                'message': 'CourtListener API token required. Get free token at https://www.courtlistener.com/help/api/'
-            }
-        
         return {
             'api_type': self.api_type,
             'source': 'courtlistener',
             'query': query,
             'filters': kwargs,
             'base_url': self.courtlistener_base_url,
-            'endpoints': {
-                'dockets': '/dockets/',
-                'opinions': '/opinions/',
-                'parties': '/parties/',
-                'attorneys': '/attorneys/'
-            },
+            'endpoints': dict(_COURTLISTENER_ENDPOINTS),
             'message': 'Mock implementation. Configure token to use real CourtListener API.'
         }
     
+    @requires_key('legiscan_key', _LEGISCAN_KEY_REQUIRED)
     def search_legislation(self, query: str, state: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """Search legislation using LegiScan API.
         
@@ -172,26 +202,12 @@ class CourtRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing legislation search results
         """
-        if not self.legiscan_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'legiscan',
-                'message': 'LegiScan API key required. Sign up at https://legiscan.com/legiscan'
-            }
-        
         return {
             'api_type': self.api_type,
             'source': 'legiscan',
             'query': query,
             'state': state,
             'filters': kwargs,
-            'data_available': [
-                'bill_text',
-                'bill_status',
-                'sponsors',
-                'votes',
-                'amendments',
-                'committee_info'
-            ],
+            'data_available': _LEGISCAN_DATA_AVAILABLE,
             'message': 'Mock implementation. Configure API key to use real LegiScan API.'
         }
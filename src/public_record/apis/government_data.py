@@ -1,20 +1,59 @@
 """Government Data API client."""
 
-from typing import Dict, Any, Optional, List
-from ..base import BaseAPIClient
+from typing import Dict, Any, Optional, List, Tuple
+import requests
+from ..base import BaseAPIClient, MOCK_MESSAGE
+from ..cache import cached_method
+
+
+_API_TYPE = 'government_data'
+
+_SEARCH_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'total': 0,
+    'message': MOCK_MESSAGE
+}
+
+_RECORD_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'message': MOCK_MESSAGE
+}
+
+# Data categories, in display order, plus a set for membership checks
+_CATEGORIES = (
+    'health',
+    'education',
+    'transportation',
+    'environment',
+    'public_safety',
+    'economy',
+    'demographics',
+    'energy',
+    'agriculture',
+    'infrastructure'
+)
+
+_CATEGORY_SET = frozenset(_CATEGORIES)
 
 
 class GovernmentDataAPI(BaseAPIClient):
     """API client for government data (e.g., data.gov, census data)."""
     
-    def __init__(self, api_key: Optional[str] = None):
+    __slots__ = ('api_type',)
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """Initialize Government Data API client.
         
         Args:
             api_key: API key for authentication
+            session: Shared requests session (optional)
         """
-        super().__init__(api_key=api_key, base_url="https://api.data.gov")
-        self.api_type = "government_data"
+        super().__init__(api_key=api_key, base_url="https://api.data.gov", session=session)
+        self.api_type = _API_TYPE
     
     def search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search for government datasets.
@@ -35,15 +74,9 @@ class GovernmentDataAPI(BaseAPIClient):
                 'page': current page
             }
         """
-        return {
-            'api_type': self.api_type,
-            'query': query,
-            'filters': kwargs,
-            'results': [],
-            'total': 0,
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_SEARCH_TEMPLATE, 'query': query, 'filters': kwargs, 'results': []}
     
+    @cached_method
     def get_record(self, dataset_id: str) -> Dict[str, Any]:
         """Get details for a specific government dataset.
         
@@ -59,12 +92,7 @@ class GovernmentDataAPI(BaseAPIClient):
             - Access URL
             - Metadata
         """
-        return {
-            'api_type': self.api_type,
-            'dataset_id': dataset_id,
-            'details': {},
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'dataset_id': dataset_id, 'details': {}}
     
     def get_dataset_data(self, dataset_id: str, **kwargs) -> Dict[str, Any]:
         """Get actual data from a dataset.
@@ -79,31 +107,26 @@ class GovernmentDataAPI(BaseAPIClient):
         Returns:
             Dictionary containing dataset records
         """
-        return {
-            'api_type': self.api_type,
-            'dataset_id': dataset_id,
-            'data': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'dataset_id': dataset_id, 'data': []}
     
-    def list_categories(self) -> List[str]:
+    def list_categories(self) -> Tuple[str, ...]:
         """List available data categories.
         
         Returns:
-            List of category names
+            Tuple of category names
+        """
+        return _CATEGORIES
+    
+    def is_valid_category(self, name: str) -> bool:
+        """Check whether a name is a known data category.
+        
+        Args:
+            name: Category name
+            
+        Returns:
+            True if the category exists
         """
-        return [
-            'health',
-            'education',
-            'transportation',
-            'environment',
-            'public_safety',
-            'economy',
-            'demographics',
-            'energy',
-            'agriculture',
-            'infrastructure'
-        ]
+        return name in _CATEGORY_SET
     
     def search_by_agency(self, agency: str) -> Dict[str, Any]:
         """Search datasets by government agency.
@@ -128,10 +151,9 @@ class GovernmentDataAPI(BaseAPIClient):
             Dictionary containing census data
         """
         return {
-            'api_type': self.api_type,
+            **_RECORD_TEMPLATE,
             'source': 'census',
             'geography': geography,
             'variables': variables,
-            'data': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
+            'data': []
         }
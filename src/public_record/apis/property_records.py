@@ -1,7 +1,120 @@
 """Property Records API client."""
 
-from typing import Dict, Any, Optional
-from ..base import BaseAPIClient
+from functools import partial
+from typing import Dict, Any, Iterable, Optional
+import requests
+from ..base import BaseAPIClient, InvalidInputError, MOCK_MESSAGE, requires_key
+from ..cache import cached_method
+from ..concurrency import fan_out
+
+
+_API_TYPE = 'property_records'
+
+_SEARCH_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'total': 0,
+    'message': MOCK_MESSAGE
+}
+
+_RECORD_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'message': MOCK_MESSAGE
+}
+
+_RENTCAST_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'rentcast',
+    'message': 'RentCast API key required. Get 50 free calls at https://www.rentcast.io/api'
+}
+
+_RENTCAST_ENDPOINTS = {
+    'property': '/properties',
+    'valuation': '/avm/value',
+    'rent_estimate': '/avm/rent',
+    'listings': '/listings/sale'
+}
+
+_RENTCAST_DATA_AVAILABLE = (
+    'property_value_estimate',
+    'rent_estimate',
+    'property_details',
+    'comparable_properties',
+    'market_statistics'
+)
+
+_FIRST_AMERICAN_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'first_american',
+    'message': 'First American API key required. Contact First American for access.'
+}
+
+# First American report type -> (endpoint, report name)
+_FIRST_AMERICAN_REPORTS = {
+    'TotalView': ('/reports/totalview', 'TotalView Report'),
+    'LegalVesting': ('/reports/legal-vesting', 'Legal & Vesting Report'),
+    'TitleChain': ('/reports/title-chain', 'Title Chain & Lien Report'),
+    'PropertyHistory': ('/reports/property-history', 'Property History Report')
+}
+
+_FIRST_AMERICAN_AVAILABLE_REPORTS = tuple(name for _, name in _FIRST_AMERICAN_REPORTS.values())
+
+_FIRST_AMERICAN_DATA_AVAILABLE = (
+    'ownership_info',
+    'property_characteristics',
+    'tax_assessment',
+    'foreclosure_activity',
+    'liens_encumbrances',
+    'HOA_information',
+    'recorded_documents',
+    'assessor_maps'
+)
+
+_HOUSECANARY_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'housecanary',
+    'message': 'HouseCanary API key required. Contact HouseCanary for access.'
+}
+
+_HOUSECANARY_DATA_CATEGORIES = (
+    'property_characteristics',
+    'market_valuations',
+    'forecasting_models',
+    'neighborhood_analytics',
+    'investment_scoring',
+    'renovation_estimates',
+    'risk_assessment'
+)
+
+_HOUSECANARY_GEOGRAPHIC_LEVELS = (
+    'individual_property',
+    'census_tract',
+    'zip_code',
+    'MSA',
+    'state'
+)
+
+_RENTCAST_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'rentcast',
+    'data_available': _RENTCAST_DATA_AVAILABLE,
+    'message': 'Mock implementation. Configure API key to use real RentCast API.'
+}
+
+_FIRST_AMERICAN_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'first_american',
+    'available_reports': _FIRST_AMERICAN_AVAILABLE_REPORTS,
+    'data_available': _FIRST_AMERICAN_DATA_AVAILABLE,
+    'message': 'Mock implementation. Configure API key to use real First American API.'
+}
+
+_HOUSECANARY_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'housecanary',
+    'data_categories': _HOUSECANARY_DATA_CATEGORIES,
+    'geographic_levels': _HOUSECANARY_GEOGRAPHIC_LEVELS,
+    'message': 'Mock implementation. Configure API key to use real HouseCanary API.'
+}
 
 
 class PropertyRecordsAPI(BaseAPIClient):
@@ -15,13 +128,26 @@ class PropertyRecordsAPI(BaseAPIClient):
     - PropStream: Investment-focused property data
     """
     
+    __slots__ = (
+        'api_type',
+        'bridge_key',
+        'first_american_key',
+        'rentcast_key',
+        'housecanary_key'
+    )
+    
+    first_american_base_url = "https://dna.firstam.com/api"
+    rentcast_base_url = "https://api.rentcast.io/v1"
+    housecanary_base_url = "https://api.housecanary.com/v2"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         bridge_key: Optional[str] = None,
         first_american_key: Optional[str] = None,
         rentcast_key: Optional[str] = None,
-        housecanary_key: Optional[str] = None
+        housecanary_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """Initialize Property Records API client.
         
@@ -31,16 +157,14 @@ class PropertyRecordsAPI(BaseAPIClient):
             first_american_key: First American API key
             rentcast_key: RentCast API key
             housecanary_key: HouseCanary API key
+            session: Shared requests session (optional)
         """
-        super().__init__(api_key=api_key, base_url="https://api.bridgedataoutput.com")
-        self.api_type = "property_records"
+        super().__init__(api_key=api_key, base_url="https://api.bridgedataoutput.com", session=session)
+        self.api_type = _API_TYPE
         self.bridge_key = bridge_key
         self.first_american_key = first_american_key
-        self.first_american_base_url = "https://dna.firstam.com/api"
         self.rentcast_key = rentcast_key
-        self.rentcast_base_url = "https://api.rentcast.io/v1"
         self.housecanary_key = housecanary_key
-        self.housecanary_base_url = "https://api.housecanary.com/v2"
     
     def search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search for property records.
@@ -61,15 +185,9 @@ class PropertyRecordsAPI(BaseAPIClient):
                 'page': current page
             }
         """
-        return {
-            'api_type': self.api_type,
-            'query': query,
-            'filters': kwargs,
-            'results': [],
-            'total': 0,
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_SEARCH_TEMPLATE, 'query': query, 'filters': kwargs, 'results': []}
     
+    @cached_method
     def get_record(self, property_id: str) -> Dict[str, Any]:
         """Get details for a specific property.
         
@@ -85,13 +203,9 @@ class PropertyRecordsAPI(BaseAPIClient):
             - Property characteristics
             - Deed information
         """
-        return {
-            'api_type': self.api_type,
-            'property_id': property_id,
-            'details': {},
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'property_id': property_id, 'details': {}}
     
+    @cached_method
     def get_by_address(self, address: str, city: str, state: str) -> Dict[str, Any]:
         """Get property record by address.
         
@@ -103,9 +217,10 @@ class PropertyRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing property information
         """
-        full_address = f"{address}, {city}, {state}"
+        full_address = ", ".join((address, city, state))
         return self.search(query=full_address, search_type='address')
     
+    @cached_method
     def get_ownership_history(self, property_id: str) -> Dict[str, Any]:
         """Get ownership history for a property.
         
@@ -115,13 +230,9 @@ class PropertyRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing ownership transfer history
         """
-        return {
-            'api_type': self.api_type,
-            'property_id': property_id,
-            'ownership_history': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'property_id': property_id, 'ownership_history': []}
     
+    @cached_method
     def get_tax_history(self, property_id: str) -> Dict[str, Any]:
         """Get tax assessment history for a property.
         
@@ -131,13 +242,9 @@ class PropertyRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing tax assessment history
         """
-        return {
-            'api_type': self.api_type,
-            'property_id': property_id,
-            'tax_history': [],
-            'message': 'Mock implementation. Configure API key to use real data.'
-        }
+        return {**_RECORD_TEMPLATE, 'property_id': property_id, 'tax_history': []}
     
+    @requires_key('rentcast_key', _RENTCAST_KEY_REQUIRED)
     def get_rentcast_valuation(self, address: str, **kwargs) -> Dict[str, Any]:
         """Get property valuation and rent estimate from RentCast.
         
@@ -151,34 +258,39 @@ class PropertyRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing valuation and rent estimate
         """
-        if not self.rentcast_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'rentcast',
-                'message': 'RentCast API key required. Get 50 free calls at https://www.rentcast.io/api'
-            }
+        return {
+            **_RENTCAST_TEMPLATE,
+            'endpoints': dict(_RENTCAST_ENDPOINTS),
+            'address': address,
+            'base_url': self.rentcast_base_url
+        }
+    
+    def bulk_valuation(self, addresses: Iterable[str], **kwargs) -> Dict[str, Any]:
+        """Get RentCast valuations for many properties concurrently.
+        
+        RentCast has no bulk endpoint, so duplicate addresses are collapsed
+        and the remaining lookups run in parallel on the shared pool.
+        
+        Args:
+            addresses: Property addresses
+            **kwargs: Additional parameters passed to every valuation lookup
+            
+        Returns:
+            Dictionary containing valuations keyed by address, in input order
+        """
+        calls = {
+            address: partial(self.get_rentcast_valuation, address, **kwargs)
+            for address in dict.fromkeys(addresses)
+        }
         
         return {
             'api_type': self.api_type,
             'source': 'rentcast',
-            'address': address,
-            'base_url': self.rentcast_base_url,
-            'endpoints': {
-                'property': '/properties',
-                'valuation': '/avm/value',
-                'rent_estimate': '/avm/rent',
-                'listings': '/listings/sale'
-            },
-            'data_available': [
-                'property_value_estimate',
-                'rent_estimate',
-                'property_details',
-                'comparable_properties',
-                'market_statistics'
-            ],
-            'message': 'Mock implementation. Configure API key to use real RentCast API.'
+            'total': len(calls),
+            'valuations': fan_out(calls)
         }
     
+    @cached_method
     def get_first_american_report(self, address: str, report_type: str = 'TotalView') -> Dict[str, Any]:
         """Get property report from First American Data & Analytics.
         
@@ -191,39 +303,32 @@ class PropertyRecordsAPI(BaseAPIClient):
             
         Returns:
             Dictionary containing property report
+            
+        Raises:
+            InvalidInputError: If report_type is not a known report type
         """
+        try:
+            endpoint, report_name = _FIRST_AMERICAN_REPORTS[report_type]
+        except KeyError:
+            raise InvalidInputError(
+                f"Invalid report type: {report_type}. "
+                f"Valid types: {', '.join(_FIRST_AMERICAN_REPORTS)}"
+            ) from None
+        
+        # Checked after the report type so bad input is rejected either way
         if not self.first_american_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'first_american',
-                'message': 'First American API key required. Contact First American for access.'
-            }
+            return dict(_FIRST_AMERICAN_KEY_REQUIRED)
         
         return {
-            'api_type': self.api_type,
-            'source': 'first_american',
+            **_FIRST_AMERICAN_TEMPLATE,
             'address': address,
             'report_type': report_type,
+            'report_name': report_name,
             'base_url': self.first_american_base_url,
-            'available_reports': [
-                'TotalView Report',
-                'Legal & Vesting Report',
-                'Title Chain & Lien Report',
-                'Property History Report'
-            ],
-            'data_available': [
-                'ownership_info',
-                'property_characteristics',
-                'tax_assessment',
-                'foreclosure_activity',
-                'liens_encumbrances',
-                'HOA_information',
-                'recorded_documents',
-                'assessor_maps'
-            ],
-            'message': 'Mock implementation. Configure API key to use real First American API.'
+            'endpoint': endpoint
         }
     
+    @requires_key('housecanary_key', _HOUSECANARY_KEY_REQUIRED)
     def get_housecanary_analytics(self, address: str, **kwargs) -> Dict[str, Any]:
         """Get AI-enhanced property analytics from HouseCanary.
         
@@ -237,33 +342,8 @@ class PropertyRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing property analytics
         """
-        if not self.housecanary_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'housecanary',
-                'message': 'HouseCanary API key required. Contact HouseCanary for access.'
-            }
-        
         return {
-            'api_type': self.api_type,
-            'source': 'housecanary',
+            **_HOUSECANARY_TEMPLATE,
             'address': address,
-            'base_url': self.housecanary_base_url,
-            'data_categories': [
-                'property_characteristics',
-                'market_valuations',
-                'forecasting_models',
-                'neighborhood_analytics',
-                'investment_scoring',
-                'renovation_estimates',
-                'risk_assessment'
-            ],
-            'geographic_levels': [
-                'individual_property',
-                'census_tract',
-                'zip_code',
-                'MSA',
-                'state'
-            ],
-            'message': 'Mock implementation. Configure API key to use real HouseCanary API.'
+            'base_url': self.housecanary_base_url
         }
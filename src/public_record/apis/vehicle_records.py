@@ -1,7 +1,134 @@
 """Vehicle and DMV Records API client."""
 
-from typing import Dict, Any, Optional
-from ..base import BaseAPIClient
+import re
+from typing import Dict, Any, Iterable, Optional
+import requests
+from ..base import BaseAPIClient, InvalidInputError
+from ..cache import cached_method
+from .vin_checksum import has_check_digit, vin_check
+
+
+_API_TYPE = 'vehicle_records'
+
+# 17 characters, excluding I, O and Q which VINs never use
+_VIN_MATCH = re.compile(r'[A-HJ-NPR-Z0-9]{17}').fullmatch
+
+# Two-letter state abbreviation
+_STATE_MATCH = re.compile(r'[A-Z]{2}').fullmatch
+
+_SEARCH_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'message': 'Mock implementation. Use decode_vin() for VIN lookups.'
+}
+
+_VIN_DECODE_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'nhtsa_vpic',
+    'base_url': 'https://vpic.nhtsa.dot.gov/api',
+    'data_available': (
+        'make',
+        'model',
+        'model_year',
+        'body_class',
+        'engine_info',
+        'transmission',
+        'manufacturer',
+        'plant_info',
+        'vehicle_type'
+    ),
+    'access': 'Free public API',
+    'message': 'Mock implementation. NHTSA vPIC provides free VIN decoding.'
+}
+
+_VINDATA_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'vindata',
+    'message': 'VINData API key required. Visit https://www.vindata.com for access.'
+}
+
+_VINDATA_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'vindata',
+    'database_size': '1B+ records',
+    'data_available': (
+        'dmv_title_info',
+        'salvage_status',
+        'junk_records',
+        'insurance_total_loss',
+        'lien_information',
+        'stolen_recovered',
+        'accident_history',
+        'inspection_reports',
+        'mechanical_condition',
+        'specifications'
+    ),
+    'coverage': (
+        'automobiles',
+        'motorcycles',
+        'specialty_vehicles'
+    ),
+    'message': 'Mock implementation. Configure API key to use real VINData API.'
+}
+
+_IDSCAN_KEY_REQUIRED = {
+    'api_type': _API_TYPE,
+    'source': 'idscan_dmv',
+    'message': 'IDScan.net API key required. Visit https://idscan.net for access.'
+}
+
+_IDSCAN_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'idscan_dmv',
+    'coverage': '40+ U.S. states',
+    'verification_types': (
+        'id_issuance_confirmed',
+        'address_verified',
+        'expiration_confirmed',
+        'license_authentic'
+    ),
+    'response_format': 'Boolean flags (does not return PII)',
+    'message': 'Mock implementation. Configure API key to use real IDScan.net API.'
+}
+
+_NMVTIS_TEMPLATE = {
+    'api_type': _API_TYPE,
+    'source': 'nmvtis',
+    'system': 'National Motor Vehicle Title Information System',
+    'managed_by': 'AAMVA',
+    'features': (
+        'instant_title_verification',
+        'interstate_title_info',
+        'anti_theft_protection',
+        'brand_verification'
+    ),
+    'access_methods': (
+        'state_web_single_vin',
+        'batch_inquiry'
+    ),
+    'message': 'Mock implementation. NMVTIS access typically through state agencies.'
+}
+
+
+def _normalize_vin(vin: str) -> str:
+    """Upper-case a VIN and reject it if it is malformed.
+    
+    The check digit is only verified for North American VINs.
+    
+    Args:
+        vin: Vehicle Identification Number
+        
+    Returns:
+        Upper-cased VIN
+        
+    Raises:
+        InvalidInputError: If the VIN has invalid characters, length or check digit
+    """
+    normalized = vin.upper()
+    if _VIN_MATCH(normalized) is None or (
+        has_check_digit(normalized) and not vin_check(normalized)
+    ):
+        raise InvalidInputError(f"Invalid VIN: {vin!r}")
+    return normalized
 
 
 class VehicleRecordsAPI(BaseAPIClient):
@@ -14,11 +141,24 @@ class VehicleRecordsAPI(BaseAPIClient):
     - NMVTIS: National Motor Vehicle Title Information System
     """
     
+    __slots__ = (
+        'api_type',
+        'vindata_key',
+        'idscan_key'
+    )
+    
+    # VIN decodes never change, so cached responses can live for a day
+    CACHE_TTL = 86400
+    
+    vindata_base_url = "https://api.vindata.com"
+    idscan_base_url = "https://api.idscan.net"
+    
     def __init__(
         self,
         api_key: Optional[str] = None,
         vindata_key: Optional[str] = None,
-        idscan_key: Optional[str] = None
+        idscan_key: Optional[str] = None,
+        session: Optional[requests.Session] = None
     ):
         """Initialize Vehicle Records API client.
         
@@ -26,13 +166,12 @@ class VehicleRecordsAPI(BaseAPIClient):
             api_key: Default API key
             vindata_key: VINData API key
             idscan_key: IDScan.net API key
+            session: Shared requests session (optional)
         """
-        super().__init__(api_key=api_key, base_url="https://vpic.nhtsa.dot.gov/api")
-        self.api_type = "vehicle_records"
+        super().__init__(api_key=api_key, base_url="https://vpic.nhtsa.dot.gov/api", session=session)
+        self.api_type = _API_TYPE
         self.vindata_key = vindata_key
-        self.vindata_base_url = "https://api.vindata.com"
         self.idscan_key = idscan_key
-        self.idscan_base_url = "https://api.idscan.net"
     
     def search(self, query: str, **kwargs) -> Dict[str, Any]:
         """Search vehicle records.
@@ -44,12 +183,7 @@ class VehicleRecordsAPI(BaseAPIClient):
         Returns:
             Dictionary containing search results
         """
-        return {
-            'api_type': self.api_type,
-            'query': query,
-            'filters': kwargs,
-            'message': 'Mock implementation. Use decode_vin() for VIN lookups.'
-        }
+        return {**_SEARCH_TEMPLATE, 'query': query, 'filters': kwargs}
     
     def get_record(self, vin: str) -> Dict[str, Any]:
         """Get vehicle record by VIN.
@@ -59,6 +193,9 @@ class VehicleRecordsAPI(BaseAPIClient):
             
         Returns:
             Dictionary containing vehicle details
+            
+        Raises:
+            InvalidInputError: If the VIN is malformed
         """
         return self.decode_vin(vin)
     
@@ -72,26 +209,46 @@ class VehicleRecordsAPI(BaseAPIClient):
             
         Returns:
             Dictionary containing vehicle specifications
+            
+        Raises:
+            InvalidInputError: If the VIN is malformed
         """
+        return self._decode_vin(_normalize_vin(vin))
+    
+    @cached_method
+    def _decode_vin(self, vin: str) -> Dict[str, Any]:
+        """Decode a VIN already normalized by _normalize_vin."""
+        return {
+            **_VIN_DECODE_TEMPLATE,
+            'vin': vin,
+            'endpoint': f'/vehicles/DecodeVin/{vin}?format=json'
+        }
+    
+    def decode_vins(self, vins: Iterable[str]) -> Dict[str, Any]:
+        """Decode many VINs.
+        
+        Every VIN is validated before any is decoded, and duplicates are
+        decoded once. Like decode_vin, this is a mock implementation that
+        makes no upstream request.
+        
+        Args:
+            vins: Vehicle Identification Numbers
+            
+        Returns:
+            Dictionary containing vehicle specifications keyed by VIN, in
+            input order
+            
+        Raises:
+            InvalidInputError: If any VIN is malformed
+        """
+        unique = dict.fromkeys(_normalize_vin(vin) for vin in vins)
+        vehicles = {vin: self.decode_vin(vin) for vin in unique}
+        
         return {
             'api_type': self.api_type,
             'source': 'nhtsa_vpic',
-            'vin': vin,
-            'base_url': 'https://vpic.nhtsa.dot.gov/api',
-            'endpoint': f'/vehicles/DecodeVin/{vin}?format=json',
-            'data_available': [
-                'make',
-                'model',
-                'model_year',
-                'body_class',
-                'engine_info',
-                'transmission',
-                'manufacturer',
-                'plant_info',
-                'vehicle_type'
-            ],
-            'access': 'Free public API',
-            'message': 'Mock implementation. NHTSA vPIC provides free VIN decoding.'
+            'total': len(vehicles),
+            'vehicles': vehicles
         }
     
     def get_vehicle_history(self, vin: str) -> Dict[str, Any]:
@@ -105,39 +262,21 @@ class VehicleRecordsAPI(BaseAPIClient):
             
         Returns:
             Dictionary containing vehicle history
+            
+        Raises:
+            InvalidInputError: If the VIN is malformed
         """
+        vin = _normalize_vin(vin)
+        
         if not self.vindata_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'vindata',
-                'message': 'VINData API key required. Visit https://www.vindata.com for access.'
-            }
+            return dict(_VINDATA_KEY_REQUIRED)
         
-        return {
-            'api_type': self.api_type,
-            'source': 'vindata',
-            'vin': vin,
-            'base_url': self.vindata_base_url,
-            'database_size': '1B+ records',
-            'data_available': [
-                'dmv_title_info',
-                'salvage_status',
-                'junk_records',
-                'insurance_total_loss',
-                'lien_information',
-                'stolen_recovered',
-                'accident_history',
-                'inspection_reports',
-                'mechanical_condition',
-                'specifications'
-            ],
-            'coverage': [
-                'automobiles',
-                'motorcycles',
-                'specialty_vehicles'
-            ],
-            'message': 'Mock implementation. Configure API key to use real VINData API.'
-        }
+        return self._vehicle_history(vin)
+    
+    @cached_method
+    def _vehicle_history(self, vin: str) -> Dict[str, Any]:
+        """Get vehicle history for a VIN already normalized by _normalize_vin."""
+        return {**_VINDATA_TEMPLATE, 'vin': vin, 'base_url': self.vindata_base_url}
     
     def verify_dmv_record(
         self,
@@ -158,31 +297,24 @@ class VehicleRecordsAPI(BaseAPIClient):
             
         Returns:
             Dictionary with verification results (boolean flags)
+            
+        Raises:
+            InvalidInputError: If state is not a two-letter abbreviation
         """
+        state = state.upper()
+        if _STATE_MATCH(state) is None:
+            raise InvalidInputError(f"Invalid state: {state!r}")
+        
         if not self.idscan_key:
-            return {
-                'api_type': self.api_type,
-                'source': 'idscan_dmv',
-                'message': 'IDScan.net API key required. Visit https://idscan.net for access.'
-            }
+            return dict(_IDSCAN_KEY_REQUIRED)
         
         return {
-            'api_type': self.api_type,
-            'source': 'idscan_dmv',
+            **_IDSCAN_TEMPLATE,
             'first_name': first_name,
             'last_name': last_name,
             'license_number': license_number,
             'state': state,
-            'base_url': self.idscan_base_url,
-            'coverage': '40+ U.S. states',
-            'verification_types': [
-                'id_issuance_confirmed',
-                'address_verified',
-                'expiration_confirmed',
-                'license_authentic'
-            ],
-            'response_format': 'Boolean flags (does not return PII)',
-            'message': 'Mock implementation. Configure API key to use real IDScan.net API.'
+            'base_url': self.idscan_base_url
         }
     
     def check_nmvtis(self, vin: str) -> Dict[str, Any]:
@@ -196,22 +328,10 @@ class VehicleRecordsAPI(BaseAPIClient):
             
         Returns:
             Dictionary containing title verification results
+            
+        Raises:
+            InvalidInputError: If the VIN is malformed
         """
-        return {
-            'api_type': self.api_type,
-            'source': 'nmvtis',
-            'vin': vin,
-            'system': 'National Motor Vehicle Title Information System',
-            'managed_by': 'AAMVA',
-            'features': [
-                'instant_title_verification',
-                'interstate_title_info',
-                'anti_theft_protection',
-                'brand_verification'
-            ],
-            'access_methods': [
-                'state_web_single_vin',
-                'batch_inquiry'
-            ],
-            'message': 'Mock implementation. NMVTIS access typically through state agencies.'
-        }
+        vin = _normalize_vin(vin)
+        
+        return {**_NMVTIS_TEMPLATE, 'vin': vin}
@@ -0,0 +1,57 @@
+"""VIN check digit validation.
+
+Implements the North American check digit (position 9) defined in
+49 CFR 565: each character is transliterated to a number, multiplied by
+its positional weight, and the sum modulo 11 must equal the check digit
+('X' stands for 10).
+"""
+
+_TRANSLITERATION = {
+    **{str(digit): digit for digit in range(10)},
+    'A': 1, 'B': 2, 'C': 3, 'D': 4, 'E': 5, 'F': 6, 'G': 7, 'H': 8,
+    'J': 1, 'K': 2, 'L': 3, 'M': 4, 'N': 5, 'P': 7, 'R': 9,
+    'S': 2, 'T': 3, 'U': 4, 'V': 5, 'W': 6, 'X': 7, 'Y': 8, 'Z': 9,
+}
+
+_WEIGHTS = (8, 7, 6, 5, 4, 3, 2, 10, 0, 9, 8, 7, 6, 5, 4, 3, 2)
+
+_CHECK_CHARS = '0123456789X'
+
+# World manufacturer identifiers assigned to North America start with 1-5
+_NORTH_AMERICAN_REGIONS = frozenset('12345')
+
+
+def vin_check(vin: str) -> bool:
+    """Check whether a VIN has a valid check digit.
+    
+    Args:
+        vin: Vehicle Identification Number
+    
+    Returns:
+        True if the VIN is 17 valid characters with a matching check digit
+    """
+    if len(vin) != 17:
+        return False
+    
+    vin = vin.upper()
+    try:
+        total = sum(_TRANSLITERATION[char] * weight for char, weight in zip(vin, _WEIGHTS))
+    except KeyError:
+        return False
+    
+    return vin[8] == _CHECK_CHARS[total % 11]
+
+
+def has_check_digit(vin: str) -> bool:
+    """Check whether a VIN is required to carry a position-9 check digit.
+    
+    Only North American VINs are; ISO 3779 VINs from other regions may use
+    position 9 for anything.
+    
+    Args:
+        vin: Vehicle Identification Number
+    
+    Returns:
+        True if the VIN was issued to a North American manufacturer
+    """
+    return vin[:1] in _NORTH_AMERICAN_REGIONS
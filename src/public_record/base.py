@@ -1,45 +1,144 @@
 """Base API client for public record APIs."""
 
+import functools
+import hashlib
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Callable, Mapping, Optional
+from urllib.parse import urlsplit
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from . import jsonlib
+from .breaker import CircuitBreaker
+from .cache import TTLCache, get_redis
+from .concurrency import SingleFlight
+
+
+logger = logging.getLogger(__name__)
+
+# Message carried by mock responses of clients without a live integration
+MOCK_MESSAGE = 'Mock implementation. Configure API key to use real data.'
+
+# Fields every Redis response cache entry must have to be used
+_CACHE_ENTRY_FIELDS = frozenset(('body', 'etag', 'last_modified', 'expires_at'))
+
+
+class InvalidInputError(ValueError):
+    """Raised when caller input is rejected before any upstream request."""
+
+
+def requires_key(attr: str, missing_response: Mapping[str, Any]) -> Callable:
+    """Short-circuit a provider method when its credential is not configured.
+    
+    Args:
+        attr: Name of the client attribute holding the provider key
+        missing_response: Response returned (as a copy) when the key is unset
+        
+    Returns:
+        Decorator for client methods
+    """
+    def decorator(func: Callable[..., Dict[str, Any]]) -> Callable[..., Dict[str, Any]]:
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            if not getattr(self, attr):
+                return dict(missing_response)
+            return func(self, *args, **kwargs)
+        
+        return wrapper
+    
+    return decorator
 
 
 class BaseAPIClient(ABC):
     """Base class for all public record API clients."""
     
-    def __init__(self, api_key: Optional[str] = None, base_url: Optional[str] = None):
+    __slots__ = ('api_key', 'base_url', 'session', '_headers', '_cache', '_breakers', '_inflight')
+    
+    # Connection pool sizing for the keep-alive session. urllib3 keeps a
+    # separate pool per upstream host, so POOL_CONNECTIONS bounds how many
+    # hosts stay warm and POOL_MAXSIZE how many sockets each host keeps.
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+    
+    # Seconds to wait for a connection and then for each read. Callers that
+    # stop waiting earlier cannot cancel a running request, so this is what
+    # frees the worker thread when an upstream hangs.
+    REQUEST_TIMEOUT = (5, 30)
+    
+    # Retry policy for transient upstream failures
+    RETRY_TOTAL = 3
+    RETRY_BACKOFF_FACTOR = 0.2
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    
+    # Sizing for the per-client cache of idempotent lookups. CACHE_TTL is
+    # also the default Redis TTL for GET responses; 0 disables both caches.
+    CACHE_MAXSIZE = 4096
+    CACHE_TTL = 3600
+    
+    # How long a Redis entry is kept after it goes stale, so that it can be
+    # revalidated with a conditional request instead of refetched in full
+    CACHE_STALE_TTL = 86400
+    
+    # Consecutive upstream failures before a host is skipped, and for how long
+    BREAKER_FAIL_MAX = 5
+    BREAKER_RESET_TIMEOUT = 60
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        session: Optional[requests.Session] = None
+    ):
         """Initialize the API client.
         
         Args:
             api_key: API key for authentication
             base_url: Base URL for the API endpoint
+            session: Session to share with other clients; a new pooled
+                session is created if omitted
         """
         self.api_key = api_key
         self.base_url = base_url
-        self.session = self._create_session()
+        self.session = session if session is not None else self._create_session()
+        self._headers = self._build_headers()
+        self._cache = TTLCache(maxsize=self.CACHE_MAXSIZE, ttl=self.CACHE_TTL)
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._inflight = SingleFlight()
+    
+    def clear_cache(self) -> None:
+        """Discard all cached lookup results for this client."""
+        self._cache.clear()
     
-    def _create_session(self) -> requests.Session:
-        """Create a requests session with retry logic."""
+    @classmethod
+    def _create_session(cls) -> requests.Session:
+        """Create a pooled keep-alive requests session with retry logic.
+        
+        Connections are reused across calls so repeated requests to the same
+        upstream host skip the TCP and TLS handshakes.
+        """
         session = requests.Session()
         
         # Configure retry strategy
         retry_strategy = Retry(
-            total=3,
-            backoff_factor=1,
-            status_forcelist=[429, 500, 502, 503, 504]
+            total=cls.RETRY_TOTAL,
+            backoff_factor=cls.RETRY_BACKOFF_FACTOR,
+            status_forcelist=cls.RETRY_STATUSES
         )
         
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=cls.POOL_CONNECTIONS,
+            pool_maxsize=cls.POOL_MAXSIZE,
+            max_retries=retry_strategy
+        )
         session.mount("http://", adapter)
         session.mount("https://", adapter)
         
         return session
     
-    def _get_headers(self) -> Dict[str, str]:
-        """Get headers for API requests.
+    def _build_headers(self) -> Dict[str, str]:
+        """Build the headers sent with every request from this client.
         
         Returns:
             Dictionary of headers
@@ -54,38 +153,216 @@ class BaseAPIClient(ABC):
         
         return headers
     
+    def _get_headers(self) -> Dict[str, str]:
+        """Get headers for API requests.
+        
+        Headers are built once in __init__. They are kept per client rather
+        than on the session because the session may be shared between clients
+        with different credentials.
+        
+        Returns:
+            Dictionary of headers
+        """
+        return self._headers
+    
     def _make_request(
         self, 
         method: str, 
         endpoint: str, 
         params: Optional[Dict[str, Any]] = None,
-        data: Optional[Dict[str, Any]] = None
+        data: Optional[Dict[str, Any]] = None,
+        no_cache: bool = False,
+        cache_ttl: Optional[float] = None
     ) -> Dict[str, Any]:
         """Make an API request.
         
+        Concurrent identical GET requests share a single upstream call. When
+        Redis caching is enabled (see cache.get_redis), GET responses are also
+        cached for cache_ttl seconds, keyed on the URL, parameters and API key.
+        Once an entry goes stale it is revalidated with If-None-Match or
+        If-Modified-Since, so an unchanged upstream answers with a bodyless
+        304 instead of resending the full response.
+        
         Args:
             method: HTTP method (GET, POST, etc.)
             endpoint: API endpoint
             params: Query parameters
             data: Request body data
+            no_cache: Always make a fresh upstream call for this request
+            cache_ttl: Seconds to cache this endpoint's response; defaults to
+                the client's CACHE_TTL, and 0 disables caching
             
         Returns:
             Response data as dictionary
             
         Raises:
             requests.exceptions.RequestException: If request fails
+            CircuitOpenError: If the upstream host has been failing repeatedly
         """
         url = f"{self.base_url}/{endpoint}" if self.base_url else endpoint
         
+        if cache_ttl is None:
+            cache_ttl = self.CACHE_TTL
+        
+        breaker = self._breaker_for(url)
+        if no_cache or cache_ttl <= 0 or method.upper() != 'GET':
+            return self._decode_response(
+                breaker.call(self._send_request, method, url, params, data)
+            )
+        
+        key = self._response_cache_key(url, params)
+        cache = get_redis()
+        entry = None
+        if cache is not None:
+            entry = self._read_cache_entry(cache, key)
+            if entry is not None and entry['expires_at'] > time.time():
+                return entry['body']
+        
+        return self._inflight.do(
+            key, self._fetch_and_store, key, cache, breaker, url, params, cache_ttl, entry
+        )
+    
+    @staticmethod
+    def _read_cache_entry(cache: Any, key: str) -> Optional[Dict[str, Any]]:
+        """Read a response cache entry, treating unusable entries as misses.
+        
+        Redis errors and entries that are corrupt or were written by something
+        else are logged and reported as a miss instead of failing the request.
+        """
+        try:
+            cached = cache.get(key)
+        except Exception as e:
+            logger.warning("Response cache read failed: %s", e)
+            return None
+        if cached is None:
+            return None
+        
+        try:
+            entry = jsonlib.loads(cached)
+            if not _CACHE_ENTRY_FIELDS <= entry.keys():
+                raise ValueError('missing fields')
+            entry['expires_at'] = float(entry['expires_at'])
+        except Exception as e:
+            logger.warning("Ignoring unreadable response cache entry %s: %s", key, e)
+            return None
+        return entry
+    
+    def _fetch_and_store(
+        self,
+        key: str,
+        cache: Optional[Any],
+        breaker: CircuitBreaker,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        cache_ttl: float,
+        stale: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Perform a GET through the breaker and store the result in Redis.
+        
+        When a stale cache entry is given, its validators are sent so that an
+        unchanged upstream can answer 304 and the cached body is reused.
+        """
+        conditional = None
+        if stale is not None:
+            conditional = {}
+            if stale['etag']:
+                conditional['If-None-Match'] = stale['etag']
+            if stale['last_modified']:
+                conditional['If-Modified-Since'] = stale['last_modified']
+        
+        response = breaker.call(self._send_request, 'GET', url, params, None, conditional)
+        if stale is not None and response.status_code == 304:
+            body = stale['body']
+            etag = response.headers.get('ETag', stale['etag'])
+            last_modified = response.headers.get('Last-Modified', stale['last_modified'])
+        else:
+            body = self._decode_response(response)
+            etag = response.headers.get('ETag')
+            last_modified = response.headers.get('Last-Modified')
+        
+        if cache is not None:
+            entry = {
+                'body': body,
+                'etag': etag,
+                'last_modified': last_modified,
+                'expires_at': time.time() + cache_ttl
+            }
+            try:
+                cache.setex(key, int(cache_ttl + self.CACHE_STALE_TTL), jsonlib.dumps(entry))
+            except Exception as e:
+                logger.warning("Response cache write failed: %s", e)
+        return body
+    
+    def _response_cache_key(self, url: str, params: Optional[Dict[str, Any]]) -> str:
+        """Build the Redis key for a GET request.
+        
+        The API key is part of the hash so that responses fetched with one
+        credential are never served to a client using another.
+        """
+        raw = b'|'.join((
+            url.encode(),
+            jsonlib.dumps(params or {}),
+            (self.api_key or '').encode()
+        ))
+        return 'pr:v2:' + hashlib.blake2b(raw, digest_size=16).hexdigest()
+    
+    def _breaker_for(self, url: str) -> CircuitBreaker:
+        """Get the circuit breaker for the host a URL points at."""
+        host = urlsplit(url).netloc
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = self._breakers.setdefault(
+                host,
+                CircuitBreaker(self.BREAKER_FAIL_MAX, self.BREAKER_RESET_TIMEOUT)
+            )
+        return breaker
+    
+    def _send_request(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+        data: Optional[Dict[str, Any]],
+        extra_headers: Optional[Dict[str, str]] = None
+    ) -> requests.Response:
+        """Send a request and raise for error statuses.
+        
+        Args:
+            method: HTTP method
+            url: Full request URL
+            params: Query parameters
+            data: Request body data
+            extra_headers: Headers added to the client's own for this request
+            
+        Returns:
+            The upstream response
+        """
+        headers = self._get_headers()
+        if extra_headers:
+            headers = {**headers, **extra_headers}
+        
         response = self.session.request(
             method=method,
             url=url,
-            headers=self._get_headers(),
+            headers=headers,
             params=params,
-            json=data
+            json=data,
+            timeout=self.REQUEST_TIMEOUT
         )
         
         response.raise_for_status()
+        return response
+    
+    @staticmethod
+    def _decode_response(response: requests.Response) -> Dict[str, Any]:
+        """Decode a JSON response body.
+        
+        Bodies served as JSON are parsed straight from bytes, since JSON is
+        always UTF-8. Anything else goes through requests' own decoding, which
+        honours the declared charset.
+        """
+        if 'json' in response.headers.get('Content-Type', ''):
+            return jsonlib.loads(response.content)
         return response.json()
     
     @abstractmethod
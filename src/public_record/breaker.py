@@ -0,0 +1,83 @@
+"""Circuit breaker for upstream API calls."""
+
+import threading
+import time
+from typing import Any, Callable, Optional
+
+import requests
+
+
+class CircuitOpenError(requests.exceptions.RequestException):
+    """Raised instead of calling an upstream whose circuit is open."""
+
+
+class CircuitBreaker:
+    """Stop calling a failing upstream for a cool-down period.
+    
+    After fail_max consecutive failures the circuit opens and calls fail fast
+    with CircuitOpenError. Once reset_timeout seconds have passed, calls are
+    let through again; another failure reopens the circuit immediately and a
+    success closes it.
+    """
+    
+    def __init__(self, fail_max: int = 5, reset_timeout: float = 60):
+        """Initialize the breaker.
+        
+        Args:
+            fail_max: Consecutive failures before the circuit opens
+            reset_timeout: Seconds the circuit stays open before retrying
+        """
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    @property
+    def is_open(self) -> bool:
+        """Whether calls are currently being rejected."""
+        opened_at = self._opened_at
+        return opened_at is not None and time.monotonic() - opened_at < self.reset_timeout
+    
+    def call(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Call func through the breaker.
+        
+        Args:
+            func: Callable performing the upstream request
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Result of func
+        
+        Raises:
+            CircuitOpenError: If the circuit is open
+        """
+        if self.is_open:
+            raise CircuitOpenError('Upstream temporarily disabled after repeated failures')
+        
+        try:
+            result = func(*args, **kwargs)
+        except requests.exceptions.RequestException as e:
+            if _is_upstream_failure(e):
+                self._record_failure()
+            raise
+        
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+        return result
+    
+    def _record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._failures >= self.fail_max:
+                self._opened_at = time.monotonic()
+
+
+def _is_upstream_failure(error: requests.exceptions.RequestException) -> bool:
+    """Client errors such as 404 say nothing about upstream health."""
+    response = getattr(error, 'response', None)
+    if response is None:
+        return True
+    return response.status_code >= 500 or response.status_code == 429
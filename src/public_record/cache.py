@@ -0,0 +1,158 @@
+"""In-process caching utilities for public record lookups."""
+
+import copy
+import functools
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+try:
+    import redis
+except ImportError:  # pragma: no cover - optional dependency
+    redis = None
+
+
+_MISSING = object()
+
+_redis_client = None
+_redis_lock = threading.Lock()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after a fixed time-to-live."""
+    
+    def __init__(self, maxsize: int = 10000, ttl: float = 3600):
+        """Initialize the cache.
+        
+        Args:
+            maxsize: Maximum number of entries kept before evicting the oldest
+            ttl: Seconds an entry stays valid after it is stored
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value.
+        
+        Args:
+            key: Cache key
+            default: Value returned when the key is missing or expired
+        
+        Returns:
+            Cached value or default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store a value in the cache.
+        
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def get_or_call(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Return the cached value for key, calling func to populate it on a miss.
+        
+        Results that are not dictionaries or that contain an 'error' key are
+        returned without being cached. The cache keeps its own deep copy and
+        hands out a fresh one on every hit, so a caller changing any part of
+        its result does not change what later callers get.
+        
+        Args:
+            key: Cache key
+            func: Callable producing the value
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Cached or freshly computed value
+        """
+        value = self.get(key, _MISSING)
+        if value is not _MISSING:
+            return copy.deepcopy(value)
+        
+        value = func(*args, **kwargs)
+        if isinstance(value, dict) and 'error' not in value:
+            self.set(key, copy.deepcopy(value))
+        return value
+    
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._data.clear()
+    
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached_method(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Cache an idempotent API client method in the client's response cache.
+    
+    Results are keyed on the method name and call arguments and stored in the
+    instance's TTLCache. Passing no_cache=True bypasses the cache for a call,
+    and calls with unhashable arguments are never cached.
+    
+    Args:
+        func: Client method to wrap
+        
+    Returns:
+        Wrapped method
+    """
+    @functools.wraps(func)
+    def wrapper(self, *args, no_cache: bool = False, **kwargs):
+        if no_cache:
+            return func(self, *args, **kwargs)
+        
+        key = (func.__name__, args, tuple(sorted(kwargs.items())))
+        try:
+            hash(key)
+        except TypeError:
+            return func(self, *args, **kwargs)
+        
+        return self._cache.get_or_call(key, func, self, *args, **kwargs)
+    
+    return wrapper
+
+
+def get_redis() -> Optional[Any]:
+    """Get the shared Redis client used to cache upstream responses.
+    
+    Redis caching is opt-in: it is enabled only when the redis package is
+    installed and PR_REDIS_URL is set.
+    
+    Returns:
+        Redis client, or None if Redis caching is not enabled
+    """
+    global _redis_client
+    
+    if redis is None:
+        return None
+    
+    url = os.environ.get('PR_REDIS_URL')
+    if not url:
+        return None
+    
+    if _redis_client is None:
+        with _redis_lock:
+            if _redis_client is None:
+                _redis_client = redis.Redis.from_url(url)
+    return _redis_client
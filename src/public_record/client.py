@@ -1,9 +1,15 @@
 """Unified Public Record API Client."""
 
-from typing import Dict, Any, Optional, List
-import os
+import warnings
+from functools import cached_property, partial
+from types import MappingProxyType
+from typing import Dict, Any, Iterable, Mapping, Optional, Tuple
+import requests
 from dotenv import load_dotenv
 
+from .base import BaseAPIClient, InvalidInputError
+from .concurrency import fan_out
+from .config import load_config
 from .apis import (
     CourtRecordsAPI,
     PropertyRecordsAPI,
@@ -14,6 +20,84 @@ from .apis import (
 )
 
 
+# (short alias, API attribute name) for every supported record type
+RECORD_TYPES = (
+    ('court', 'court_records'),
+    ('property', 'property_records'),
+    ('business', 'business_registration'),
+    ('government', 'government_data'),
+    ('background', 'background_check'),
+    ('vehicle', 'vehicle_records')
+)
+
+# An API counts as configured when any of its credentials is set
+_STATUS_RULES = (
+    ('court_records', ('UNICOURT_API_KEY', 'PACER_USERNAME')),
+    ('property_records', ('BRIDGE_API_KEY', 'RENTCAST_API_KEY')),
+    ('business_registration', ('OPENCORPORATES_API_KEY', 'CORESIGNAL_API_KEY')),
+    ('government_data', ('DATA_GOV_API_KEY',)),
+    ('background_check', ('CHECKR_API_KEY', 'IDENFY_API_KEY')),
+    ('vehicle_records', ('VINDATA_API_KEY', 'IDSCAN_API_KEY'))
+)
+
+# Canonical API names, in display order
+API_NAMES = tuple(name for _, name in RECORD_TYPES)
+
+# Record type dispatch table, keyed by both short and full names
+_RECORD_TYPE_NAMES = {
+    key: name
+    for alias, name in RECORD_TYPES
+    for key in (alias, name)
+}
+
+_VALID_TYPES_HINT = "Valid types: court, property, business, government, background, vehicle"
+
+
+def resolve_record_types(record_types: Iterable[str]) -> Tuple[str, ...]:
+    """Resolve record type names to API names.
+    
+    Args:
+        record_types: Short or full record type names, or 'all'; a single
+            name may be passed as a plain string
+        
+    Returns:
+        Selected API names, without duplicates and in canonical order
+        
+    Raises:
+        InvalidInputError: If any name is not a known record type
+    """
+    if isinstance(record_types, str):
+        record_types = (record_types,)
+    
+    selected = set()
+    unknown = []
+    for record_type in record_types:
+        key = record_type.lower()
+        if key == 'all':
+            selected.update(API_NAMES)
+        elif key in _RECORD_TYPE_NAMES:
+            selected.add(_RECORD_TYPE_NAMES[key])
+        else:
+            unknown.append(record_type)
+    
+    if unknown:
+        raise InvalidInputError(
+            f"Invalid record type(s): {', '.join(unknown)}. "
+            + _VALID_TYPES_HINT
+        )
+    return tuple(name for name in API_NAMES if name in selected)
+
+
+# Placeholder returned (as a copy) by search_all for APIs without credentials
+UNCONFIGURED_RESPONSE = {
+    'skipped': True,
+    'message': 'No API key configured for this record type.'
+}
+
+# Whether .env has already been read in this process
+_DOTENV_LOADED = False
+
+
 class PublicRecordClient:
     """Unified client for accessing all public record APIs."""
     
@@ -21,106 +105,184 @@ class PublicRecordClient:
         """Initialize the unified public record client.
         
         Args:
-            load_env: Whether to load API keys from .env file
+            load_env: Whether to load API keys from .env file. The file is
+                read once per process; pass False when the environment is
+                already populated, e.g. by the container
         """
         if load_env:
-            load_dotenv()
+            self.preload_env()
         
-        # Initialize Court Records API
-        self.court_records = CourtRecordsAPI(
-            api_key=os.getenv('UNICOURT_API_KEY'),
-            pacer_username=os.getenv('PACER_USERNAME'),
-            pacer_password=os.getenv('PACER_PASSWORD'),
-            courtlistener_token=os.getenv('COURTLISTENER_API_KEY'),
-            legiscan_key=os.getenv('LEGISCAN_API_KEY')
-        )
+        # Read credentials once; every sub-client is built from this snapshot
+        self.config = config = load_config()
         
-        # Initialize Property Records API
-        self.property_records = PropertyRecordsAPI(
-            api_key=os.getenv('BRIDGE_API_KEY'),
-            bridge_key=os.getenv('BRIDGE_API_KEY'),
-            first_american_key=os.getenv('FIRST_AMERICAN_API_KEY'),
-            rentcast_key=os.getenv('RENTCAST_API_KEY'),
-            housecanary_key=os.getenv('HOUSECANARY_API_KEY')
-        )
+        # Configuration status is fixed for the lifetime of the client
+        self._api_status = MappingProxyType({
+            name: any(config[key] for key in keys)
+            for name, keys in _STATUS_RULES
+        })
+    
+    @classmethod
+    def preload_env(cls) -> None:
+        """Load API keys from the .env file into the environment.
         
-        # Initialize Business Registration API
-        self.business_registration = BusinessRegistrationAPI(
-            api_key=os.getenv('OPENCORPORATES_API_KEY'),
-            opencorporates_key=os.getenv('OPENCORPORATES_API_KEY'),
-            coresignal_key=os.getenv('CORESIGNAL_API_KEY'),
-            companies_api_key=os.getenv('COMPANIES_API_KEY')
-        )
+        Only the first call reads the file. Call it at application startup to
+        keep that filesystem work out of the first client construction.
+        """
+        global _DOTENV_LOADED
         
-        # Initialize Government Data API
-        self.government_data = GovernmentDataAPI(
-            api_key=os.getenv('DATA_GOV_API_KEY')
+        if not _DOTENV_LOADED:
+            load_dotenv()
+            _DOTENV_LOADED = True
+    
+    # Sub-clients are built on first use, so a caller that only needs one
+    # record type never pays for the others
+    @cached_property
+    def session(self) -> requests.Session:
+        """Pooled session shared by every sub-client."""
+        return BaseAPIClient._create_session()
+    
+    @cached_property
+    def court_records(self) -> CourtRecordsAPI:
+        """Court Records API client."""
+        config = self.config
+        return CourtRecordsAPI(
+            api_key=config['UNICOURT_API_KEY'],
+            pacer_username=config['PACER_USERNAME'],
+            pacer_password=config['PACER_PASSWORD'],
+            courtlistener_token=config['COURTLISTENER_API_KEY'],
+            legiscan_key=config['LEGISCAN_API_KEY'],
+            session=self.session
         )
-        
-        # Initialize Background Check API
-        self.background_check = BackgroundCheckAPI(
-            api_key=os.getenv('CHECKR_API_KEY'),
-            checkr_key=os.getenv('CHECKR_API_KEY'),
-            gridlines_key=os.getenv('GRIDLINES_API_KEY'),
-            idenfy_key=os.getenv('IDENFY_API_KEY')
+    
+    @cached_property
+    def property_records(self) -> PropertyRecordsAPI:
+        """Property Records API client."""
+        config = self.config
+        return PropertyRecordsAPI(
+            api_key=config['BRIDGE_API_KEY'],
+            bridge_key=config['BRIDGE_API_KEY'],
+            first_american_key=config['FIRST_AMERICAN_API_KEY'],
+            rentcast_key=config['RENTCAST_API_KEY'],
+            housecanary_key=config['HOUSECANARY_API_KEY'],
+            session=self.session
         )
-        
-        # Initialize Vehicle Records API
-        self.vehicle_records = VehicleRecordsAPI(
-            api_key=os.getenv('NHTSA_API_KEY'),
-            vindata_key=os.getenv('VINDATA_API_KEY'),
-            idscan_key=os.getenv('IDSCAN_API_KEY')
+    
+    @cached_property
+    def business_registration(self) -> BusinessRegistrationAPI:
+        """Business Registration API client."""
+        config = self.config
+        return BusinessRegistrationAPI(
+            api_key=config['OPENCORPORATES_API_KEY'],
+            opencorporates_key=config['OPENCORPORATES_API_KEY'],
+            coresignal_key=config['CORESIGNAL_API_KEY'],
+            companies_api_key=config['COMPANIES_API_KEY'],
+            session=self.session
+        )
+    
+    @cached_property
+    def government_data(self) -> GovernmentDataAPI:
+        """Government Data API client."""
+        return GovernmentDataAPI(
+            api_key=self.config['DATA_GOV_API_KEY'],
+            session=self.session
         )
     
-    def search_all(self, query: str, **kwargs) -> Dict[str, Any]:
+    @cached_property
+    def background_check(self) -> BackgroundCheckAPI:
+        """Background Check API client."""
+        config = self.config
+        return BackgroundCheckAPI(
+            api_key=config['CHECKR_API_KEY'],
+            checkr_key=config['CHECKR_API_KEY'],
+            gridlines_key=config['GRIDLINES_API_KEY'],
+            idenfy_key=config['IDENFY_API_KEY'],
+            session=self.session
+        )
+    
+    @cached_property
+    def vehicle_records(self) -> VehicleRecordsAPI:
+        """Vehicle Records API client."""
+        config = self.config
+        return VehicleRecordsAPI(
+            api_key=config['NHTSA_API_KEY'],
+            vindata_key=config['VINDATA_API_KEY'],
+            idscan_key=config['IDSCAN_API_KEY'],
+            session=self.session
+        )
+    
+    def search_all(
+        self,
+        query: str,
+        filters: Optional[Mapping[str, Any]] = None,
+        *,
+        parallel: bool = True,
+        include: Optional[Iterable[str]] = None,
+        timeout: Optional[float] = None,
+        **kwargs
+    ) -> Dict[str, Any]:
         """Search across all public record APIs.
         
+        APIs without configured credentials are not called; their entry holds
+        a placeholder marked with 'skipped'. The configured APIs are
+        searched concurrently unless parallel is False.
+        
+        Search parameters passed as keyword arguments are still accepted but
+        deprecated: they cannot use the names of this method's own options,
+        so pass them in filters instead.
+        
         Args:
             query: Search query
-            **kwargs: Additional search parameters
+            filters: Additional search parameters passed to every API
+            parallel: Whether to run the searches concurrently
+            include: Record types to search (short or full names); all
+                types are searched if omitted
+            timeout: Seconds to wait for the concurrent searches; APIs that
+                have not answered by then get an error entry. Sequential
+                searches are not bounded
+            **kwargs: Deprecated; additional search parameters
             
         Returns:
-            Dictionary containing results from all APIs
+            Dictionary containing results from the selected APIs
+            
+        Raises:
+            InvalidInputError: If include names an unknown record type
         """
-        results = {}
-        
-        # Search court records
-        try:
-            results['court_records'] = self.court_records.search(query, **kwargs)
-        except Exception as e:
-            results['court_records'] = {'error': str(e)}
-        
-        # Search property records
-        try:
-            results['property_records'] = self.property_records.search(query, **kwargs)
-        except Exception as e:
-            results['property_records'] = {'error': str(e)}
-        
-        # Search business registrations
-        try:
-            results['business_registration'] = self.business_registration.search(query, **kwargs)
-        except Exception as e:
-            results['business_registration'] = {'error': str(e)}
+        if include is None:
+            names = API_NAMES
+        else:
+            names = resolve_record_types(include)
         
-        # Search government data
-        try:
-            results['government_data'] = self.government_data.search(query, **kwargs)
-        except Exception as e:
-            results['government_data'] = {'error': str(e)}
+        if kwargs:
+            warnings.warn(
+                "Passing search parameters to search_all as keyword arguments is "
+                "deprecated; pass them in the filters mapping instead",
+                DeprecationWarning,
+                stacklevel=2
+            )
+            filters = {**(filters or {}), **kwargs}
+        elif filters is None:
+            filters = {}
         
-        # Search background checks
-        try:
-            results['background_check'] = self.background_check.search(query, **kwargs)
-        except Exception as e:
-            results['background_check'] = {'error': str(e)}
+        calls = {
+            name: partial(getattr(self, name).search, query, **filters)
+            for name in names
+            if self._api_status[name]
+        }
         
-        # Search vehicle records
-        try:
-            results['vehicle_records'] = self.vehicle_records.search(query, **kwargs)
-        except Exception as e:
-            results['vehicle_records'] = {'error': str(e)}
+        if parallel and len(calls) > 1:
+            found = fan_out(calls, timeout)
+        else:
+            found = {}
+            for name, call in calls.items():
+                try:
+                    found[name] = call()
+                except Exception as e:
+                    found[name] = {'error': str(e)}
         
-        return results
+        return {
+            name: found[name] if name in found else dict(UNCONFIGURED_RESPONSE)
+            for name in names
+        }
     
     def search_by_type(self, record_type: str, query: str, **kwargs) -> Dict[str, Any]:
         """Search a specific type of public record.
@@ -132,26 +294,19 @@ class PublicRecordClient:
             
         Returns:
             Search results for the specified record type
+            
+        Raises:
+            InvalidInputError: If record_type is not a known record type
         """
-        record_type = record_type.lower()
-        
-        if record_type in ['court', 'court_records']:
-            return self.court_records.search(query, **kwargs)
-        elif record_type in ['property', 'property_records']:
-            return self.property_records.search(query, **kwargs)
-        elif record_type in ['business', 'business_registration']:
-            return self.business_registration.search(query, **kwargs)
-        elif record_type in ['government', 'government_data']:
-            return self.government_data.search(query, **kwargs)
-        elif record_type in ['background', 'background_check']:
-            return self.background_check.search(query, **kwargs)
-        elif record_type in ['vehicle', 'vehicle_records']:
-            return self.vehicle_records.search(query, **kwargs)
-        else:
-            raise ValueError(
-                f"Invalid record type: {record_type}. "
-                f"Valid types: court, property, business, government, background, vehicle"
-            )
+        try:
+            search = getattr(self, _RECORD_TYPE_NAMES[record_type.lower()]).search
+        except KeyError:
+            raise InvalidInputError(
+                f"Invalid record type: {record_type.lower()}. "
+                + _VALID_TYPES_HINT
+            ) from None
+        
+        return search(query, **kwargs)
     
     def get_record_by_type(self, record_type: str, record_id: str) -> Dict[str, Any]:
         """Get a specific record by type and ID.
@@ -162,41 +317,27 @@ class PublicRecordClient:
             
         Returns:
             Record details
+            
+        Raises:
+            InvalidInputError: If record_type is not a known record type
         """
-        record_type = record_type.lower()
-        
-        if record_type in ['court', 'court_records']:
-            return self.court_records.get_record(record_id)
-        elif record_type in ['property', 'property_records']:
-            return self.property_records.get_record(record_id)
-        elif record_type in ['business', 'business_registration']:
-            return self.business_registration.get_record(record_id)
-        elif record_type in ['government', 'government_data']:
-            return self.government_data.get_record(record_id)
-        elif record_type in ['background', 'background_check']:
-            return self.background_check.get_record(record_id)
-        elif record_type in ['vehicle', 'vehicle_records']:
-            return self.vehicle_records.get_record(record_id)
-        else:
-            raise ValueError(
-                f"Invalid record type: {record_type}. "
-                f"Valid types: court, property, business, government, background, vehicle"
-            )
+        try:
+            get_record = getattr(self, _RECORD_TYPE_NAMES[record_type.lower()]).get_record
+        except KeyError:
+            raise InvalidInputError(
+                f"Invalid record type: {record_type.lower()}. "
+                + _VALID_TYPES_HINT
+            ) from None
+        
+        return get_record(record_id)
     
-    def get_available_apis(self) -> List[str]:
+    def get_available_apis(self) -> Tuple[str, ...]:
         """Get list of available API types.
         
         Returns:
-            List of API type names
+            Tuple of API type names
         """
-        return [
-            'court_records',
-            'property_records',
-            'business_registration',
-            'government_data',
-            'background_check',
-            'vehicle_records'
-        ]
+        return API_NAMES
     
     def get_api_status(self) -> Dict[str, bool]:
         """Check which APIs have valid API keys configured.
@@ -204,11 +345,4 @@ class PublicRecordClient:
         Returns:
             Dictionary mapping API types to configuration status
         """
-        return {
-            'court_records': bool(os.getenv('UNICOURT_API_KEY') or os.getenv('PACER_USERNAME')),
-            'property_records': bool(os.getenv('BRIDGE_API_KEY') or os.getenv('RENTCAST_API_KEY')),
-            'business_registration': bool(os.getenv('OPENCORPORATES_API_KEY') or os.getenv('CORESIGNAL_API_KEY')),
-            'government_data': bool(os.getenv('DATA_GOV_API_KEY')),
-            'background_check': bool(os.getenv('CHECKR_API_KEY') or os.getenv('IDENFY_API_KEY')),
-            'vehicle_records': bool(os.getenv('VINDATA_API_KEY') or os.getenv('IDSCAN_API_KEY'))
-        }
+        return dict(self._api_status)
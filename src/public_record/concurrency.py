@@ -0,0 +1,127 @@
+"""Helpers for running independent upstream calls concurrently."""
+
+import copy
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError, as_completed
+from typing import Any, Callable, Dict, Hashable, Iterator, Mapping, Optional, Tuple
+
+
+# Shared by all clients; upstream calls spend nearly all their time waiting
+# on the network, so threads overlap them well despite the GIL.
+_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix='public-record')
+
+# Error reported for calls that miss the fan-out deadline
+TIMEOUT_MESSAGE = 'Request timed out'
+
+
+def fan_out(
+    calls: Mapping[str, Callable[[], Any]],
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Run independent calls concurrently and collect their results.
+    
+    A call that raises, or has not finished when the timeout runs out,
+    produces an {'error': message} entry instead of failing the whole batch.
+    Calls must not themselves call fan_out, since nested waits on the shared
+    pool can exhaust it.
+    
+    Args:
+        calls: Mapping of result name to zero-argument callable
+        timeout: Seconds to wait for the whole batch, or None to wait
+            indefinitely
+    
+    Returns:
+        Dictionary mapping each name to its result, in the order of calls
+    """
+    found = dict(fan_out_as_completed(calls, timeout))
+    return {name: found[name] for name in calls}
+
+
+def fan_out_as_completed(
+    calls: Mapping[str, Callable[[], Any]],
+    timeout: Optional[float] = None
+) -> Iterator[Tuple[str, Any]]:
+    """Run independent calls concurrently, yielding results as they finish.
+    
+    Behaves like fan_out, but yields each (name, result) pair as soon as the
+    call completes. Calls still running when the timeout runs out are
+    cancelled if possible and yielded last with an error entry.
+    
+    Args:
+        calls: Mapping of result name to zero-argument callable
+        timeout: Seconds to wait for the whole batch, or None to wait
+            indefinitely
+    
+    Yields:
+        (name, result) pairs in completion order
+    """
+    futures = {_executor.submit(call): name for name, call in calls.items()}
+    pending = set(futures)
+    
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            pending.discard(future)
+            yield futures[future], _result_or_error(future)
+    except TimeoutError:
+        for future in pending:
+            if future.done():
+                yield futures[future], _result_or_error(future)
+            else:
+                future.cancel()
+                yield futures[future], {'error': TIMEOUT_MESSAGE}
+
+
+def _result_or_error(future: Future) -> Any:
+    """Get a finished future's result, or an error entry if it raised."""
+    try:
+        return future.result()
+    except Exception as e:
+        return {'error': str(e)}
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one execution.
+    
+    The first caller for a key runs the function; callers arriving while it
+    is still running wait for its result (or exception) instead of repeating
+    the work. Waiting callers each get a deep copy of the result, so no two
+    callers share any part of it.
+    """
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, Future] = {}
+    
+    def do(self, key: Hashable, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """Run func once for all concurrent callers using the same key.
+        
+        Args:
+            key: Identifies equivalent calls
+            func: Callable producing the value
+            *args: Positional arguments for func
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Result of func, possibly computed for another caller
+        """
+        with self._lock:
+            future = self._calls.get(key)
+            leader = future is None
+            if leader:
+                future = self._calls[key] = Future()
+        
+        if not leader:
+            return copy.deepcopy(future.result())
+        
+        try:
+            result = func(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            # Waiters copy from a snapshot the leader's caller cannot reach
+            future.set_result(copy.deepcopy(result))
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
@@ -0,0 +1,50 @@
+"""Configuration snapshot for public record API credentials."""
+
+import logging
+import os
+from types import MappingProxyType
+from typing import Mapping, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Environment variables read by PublicRecordClient
+ENV_KEYS = (
+    'UNICOURT_API_KEY',
+    'PACER_USERNAME',
+    'PACER_PASSWORD',
+    'COURTLISTENER_API_KEY',
+    'LEGISCAN_API_KEY',
+    'BRIDGE_API_KEY',
+    'FIRST_AMERICAN_API_KEY',
+    'RENTCAST_API_KEY',
+    'HOUSECANARY_API_KEY',
+    'OPENCORPORATES_API_KEY',
+    'CORESIGNAL_API_KEY',
+    'COMPANIES_API_KEY',
+    'DATA_GOV_API_KEY',
+    'CHECKR_API_KEY',
+    'GRIDLINES_API_KEY',
+    'IDENFY_API_KEY',
+    'NHTSA_API_KEY',
+    'VINDATA_API_KEY',
+    'IDSCAN_API_KEY'
+)
+
+
+def load_config() -> Mapping[str, Optional[str]]:
+    """Snapshot the API credentials from the environment.
+    
+    The returned mapping is read-only, so later changes to os.environ do not
+    affect clients built from it.
+    
+    Returns:
+        Read-only mapping of every name in ENV_KEYS to its value (or None)
+    """
+    config = {key: os.environ.get(key) or None for key in ENV_KEYS}
+    
+    missing = [key for key, value in config.items() if value is None]
+    if missing:
+        logger.info("API credentials not configured: %s", ', '.join(missing))
+    
+    return MappingProxyType(config)
@@ -0,0 +1,48 @@
+"""JSON encoding helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+``json`` module otherwise.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+
+def dumps(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Serialize an object to UTF-8 encoded JSON.
+    
+    Args:
+        obj: Object to serialize
+        default: Fallback serializer for unsupported types
+    
+    Returns:
+        JSON document as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            obj,
+            default=default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS
+        )
+    return json.dumps(
+        obj, default=default, sort_keys=True, separators=(',', ':')
+    ).encode('utf-8')
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """Deserialize a JSON document.
+    
+    Args:
+        data: JSON document as bytes or str
+    
+    Returns:
+        Deserialized Python object
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -320,6 +320,9 @@ function displayResults(data) {
         if (hasError) {
             badgeClass = 'badge-error';
             badgeText = 'Error';
+        } else if (result.skipped) {
+            badgeClass = 'badge-warning';
+            badgeText = 'Not Configured';
         } else if (result.message && result.message.includes('Mock implementation')) {
             badgeClass = 'badge-warning';
             badgeText = 'Demo Mode';
@@ -0,0 +1,124 @@
+"""Tests for BaseAPIClient's Redis response cache and revalidation."""
+
+import json
+import time
+import unittest
+from unittest import mock
+
+import requests
+
+from src.public_record import base
+from src.public_record.apis.background_check import BackgroundCheckAPI
+from src.public_record.apis.court_records import CourtRecordsAPI
+
+ENDPOINT = 'cases'
+
+
+class FakeRedis:
+    """Dictionary-backed stand-in for the get/setex subset of redis.Redis."""
+
+    def __init__(self):
+        self.data = {}
+        self.ttls = {}
+
+    def get(self, key):
+        return self.data.get(key)
+
+    def setex(self, key, ttl, value):
+        self.data[key] = value
+        self.ttls[key] = ttl
+
+
+def _response(status=200, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status
+    response._content = json.dumps(body).encode() if body is not None else b''
+    response.headers.update({'Content-Type': 'application/json', **(headers or {})})
+    return response
+
+
+class ResponseCacheTest(unittest.TestCase):
+
+    def setUp(self):
+        self.redis = FakeRedis()
+        patcher = mock.patch.object(base, 'get_redis', return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.client = CourtRecordsAPI()
+        self.client.session.request = mock.Mock()
+        self.key = self.client._response_cache_key(f'{self.client.base_url}/{ENDPOINT}', None)
+
+    def store(self, body, expires_at, etag='"v1"', last_modified=None):
+        self.redis.data[self.key] = json.dumps({
+            'body': body,
+            'etag': etag,
+            'last_modified': last_modified,
+            'expires_at': expires_at
+        }).encode()
+
+    def test_response_is_stored_and_served_from_cache(self):
+        self.client.session.request.return_value = _response(body={'id': 1}, headers={'ETag': '"v1"'})
+
+        self.assertEqual(self.client._make_request('GET', ENDPOINT), {'id': 1})
+        self.assertEqual(self.client._make_request('GET', ENDPOINT), {'id': 1})
+
+        self.client.session.request.assert_called_once()
+        self.assertEqual(self.redis.ttls[self.key], self.client.CACHE_TTL + self.client.CACHE_STALE_TTL)
+
+    def test_stale_entry_is_revalidated_and_304_reuses_body(self):
+        self.store({'id': 1}, time.time() - 1, last_modified='Mon, 01 Jan 2024 00:00:00 GMT')
+        self.client.session.request.return_value = _response(status=304)
+
+        self.assertEqual(self.client._make_request('GET', ENDPOINT), {'id': 1})
+
+        headers = self.client.session.request.call_args.kwargs['headers']
+        self.assertEqual(headers['If-None-Match'], '"v1"')
+        self.assertEqual(headers['If-Modified-Since'], 'Mon, 01 Jan 2024 00:00:00 GMT')
+        entry = json.loads(self.redis.data[self.key])
+        self.assertEqual(entry['body'], {'id': 1})
+        self.assertGreater(entry['expires_at'], time.time())
+
+    def test_stale_entry_is_replaced_when_upstream_changed(self):
+        self.store({'id': 1}, time.time() - 1)
+        self.client.session.request.return_value = _response(body={'id': 2}, headers={'ETag': '"v2"'})
+
+        self.assertEqual(self.client._make_request('GET', ENDPOINT), {'id': 2})
+
+        entry = json.loads(self.redis.data[self.key])
+        self.assertEqual((entry['body'], entry['etag']), ({'id': 2}, '"v2"'))
+
+    def test_corrupt_entry_is_treated_as_a_miss(self):
+        for corrupt in (b'not json', json.dumps({'body': {'id': 1}}).encode()):
+            with self.subTest(entry=corrupt):
+                self.redis.data[self.key] = corrupt
+                self.client.session.request.return_value = _response(body={'id': 2})
+
+                self.assertEqual(self.client._make_request('GET', ENDPOINT), {'id': 2})
+                self.assertNotIn('If-None-Match', self.client.session.request.call_args.kwargs['headers'])
+
+    def test_no_cache_skips_redis(self):
+        self.store({'id': 1}, time.time() + 60)
+        self.client.session.request.return_value = _response(body={'id': 2})
+
+        self.assertEqual(self.client._make_request('GET', ENDPOINT, no_cache=True), {'id': 2})
+
+    def test_every_request_has_a_timeout(self):
+        self.client.session.request.return_value = _response(body={'id': 1})
+
+        self.client._make_request('POST', ENDPOINT, data={'q': 'x'})
+
+        self.assertEqual(self.client.session.request.call_args.kwargs['timeout'], base.BaseAPIClient.REQUEST_TIMEOUT)
+
+    def test_client_with_zero_ttl_never_writes_to_redis(self):
+        client = BackgroundCheckAPI()
+        client.session.request = mock.Mock(return_value=_response(body={'id': 1}))
+
+        client._make_request('GET', ENDPOINT)
+        client._make_request('GET', ENDPOINT)
+
+        self.assertEqual(self.redis.data, {})
+        self.assertEqual(client.session.request.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for the upstream circuit breaker."""
+
+import unittest
+from unittest import mock
+
+import requests
+
+from src.public_record import breaker
+from src.public_record.breaker import CircuitBreaker, CircuitOpenError
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(response=response)
+
+
+class CircuitBreakerTest(unittest.TestCase):
+
+    def setUp(self):
+        patcher = mock.patch.object(breaker.time, 'monotonic', return_value=1000.0)
+        self.clock = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.breaker = CircuitBreaker(fail_max=5, reset_timeout=60)
+
+    def fail(self, error):
+        with self.assertRaises(type(error)):
+            self.breaker.call(mock.Mock(side_effect=error))
+
+    def test_opens_after_fail_max_failures(self):
+        for _ in range(4):
+            self.fail(requests.exceptions.ConnectionError())
+        self.assertFalse(self.breaker.is_open)
+
+        self.fail(_http_error(503))
+        self.assertTrue(self.breaker.is_open)
+
+        func = mock.Mock()
+        with self.assertRaises(CircuitOpenError):
+            self.breaker.call(func)
+        func.assert_not_called()
+
+    def test_lets_calls_through_after_reset_timeout(self):
+        for _ in range(5):
+            self.fail(requests.exceptions.Timeout())
+
+        self.clock.return_value = 1061.0
+        self.assertFalse(self.breaker.is_open)
+        self.assertEqual(self.breaker.call(lambda: 'ok'), 'ok')
+
+    def test_failure_after_reset_reopens_immediately(self):
+        for _ in range(5):
+            self.fail(requests.exceptions.Timeout())
+
+        self.clock.return_value = 1061.0
+        self.fail(requests.exceptions.Timeout())
+        self.assertTrue(self.breaker.is_open)
+
+    def test_success_resets_the_failure_count(self):
+        for _ in range(4):
+            self.fail(requests.exceptions.ConnectionError())
+        self.breaker.call(lambda: 'ok')
+        for _ in range(4):
+            self.fail(requests.exceptions.ConnectionError())
+
+        self.assertFalse(self.breaker.is_open)
+
+    def test_client_errors_are_not_counted(self):
+        for _ in range(10):
+            self.fail(_http_error(404))
+
+        self.assertFalse(self.breaker.is_open)
+
+    def test_rate_limiting_is_counted(self):
+        for _ in range(5):
+            self.fail(_http_error(429))
+
+        self.assertTrue(self.breaker.is_open)
+
+
+if __name__ == '__main__':
+    unittest.main()
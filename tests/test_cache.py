@@ -0,0 +1,94 @@
+"""Tests for the in-process TTL cache and cached_method."""
+
+import unittest
+from unittest import mock
+
+from src.public_record import cache
+from src.public_record.cache import TTLCache, cached_method
+
+
+class TTLCacheTest(unittest.TestCase):
+
+    def test_entry_expires_after_ttl(self):
+        with mock.patch.object(cache.time, 'monotonic', return_value=100.0) as clock:
+            ttl_cache = TTLCache(maxsize=10, ttl=5)
+            ttl_cache.set('key', 'value')
+
+            clock.return_value = 104.9
+            self.assertEqual(ttl_cache.get('key'), 'value')
+
+            clock.return_value = 105.1
+            self.assertIsNone(ttl_cache.get('key'))
+            self.assertEqual(len(ttl_cache), 0)
+
+    def test_least_recently_used_entry_is_evicted(self):
+        ttl_cache = TTLCache(maxsize=2, ttl=60)
+        ttl_cache.set('a', 1)
+        ttl_cache.set('b', 2)
+        ttl_cache.get('a')
+        ttl_cache.set('c', 3)
+
+        self.assertEqual(ttl_cache.get('a'), 1)
+        self.assertIsNone(ttl_cache.get('b'))
+        self.assertEqual(ttl_cache.get('c'), 3)
+
+    def test_get_or_call_computes_once(self):
+        ttl_cache = TTLCache(maxsize=10, ttl=60)
+        func = mock.Mock(return_value={'id': 1})
+
+        ttl_cache.get_or_call('key', func)
+        ttl_cache.get_or_call('key', func)
+
+        func.assert_called_once_with()
+
+    def test_get_or_call_does_not_cache_errors(self):
+        ttl_cache = TTLCache(maxsize=10, ttl=60)
+        func = mock.Mock(return_value={'error': 'upstream failed'})
+
+        ttl_cache.get_or_call('key', func)
+        ttl_cache.get_or_call('key', func)
+
+        self.assertEqual(func.call_count, 2)
+
+    def test_nested_mutation_does_not_reach_the_cache(self):
+        ttl_cache = TTLCache(maxsize=10, ttl=60)
+        make = lambda: {'details': {}, 'results': []}
+
+        first = ttl_cache.get_or_call('key', make)
+        first['details']['owner'] = 'mutated'
+        second = ttl_cache.get_or_call('key', make)
+        second['results'].append('mutated')
+
+        self.assertEqual(ttl_cache.get_or_call('key', make), {'details': {}, 'results': []})
+
+
+class CachedMethodTest(unittest.TestCase):
+
+    class Client:
+        def __init__(self):
+            self._cache = TTLCache(maxsize=10, ttl=60)
+            self.calls = 0
+
+        @cached_method
+        def lookup(self, record_id):
+            self.calls += 1
+            return {'id': record_id}
+
+    def test_repeated_lookup_is_cached(self):
+        client = self.Client()
+        client.lookup('a')
+        client.lookup('a')
+        client.lookup('b')
+
+        self.assertEqual(client.calls, 2)
+
+    def test_no_cache_bypasses_the_cache(self):
+        client = self.Client()
+        client.lookup('a')
+        client.lookup('a', no_cache=True)
+
+        self.assertEqual(client.calls, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
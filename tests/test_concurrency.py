@@ -0,0 +1,127 @@
+"""Tests for fan_out and SingleFlight."""
+
+import threading
+import time
+import unittest
+
+from src.public_record.concurrency import (
+    TIMEOUT_MESSAGE,
+    SingleFlight,
+    fan_out,
+    fan_out_as_completed
+)
+
+
+class FanOutTest(unittest.TestCase):
+
+    def test_results_keep_call_order(self):
+        calls = {
+            'slow': lambda: time.sleep(0.05) or 'slow',
+            'fast': lambda: 'fast'
+        }
+
+        self.assertEqual(list(fan_out(calls).items()), [('slow', 'slow'), ('fast', 'fast')])
+
+    def test_errors_are_captured_per_call(self):
+        def broken():
+            raise RuntimeError('boom')
+
+        results = fan_out({'ok': lambda: 1, 'broken': broken})
+
+        self.assertEqual(results, {'ok': 1, 'broken': {'error': 'boom'}})
+
+    def test_timeout_bounds_the_whole_batch(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = {name: release.wait for name in ('a', 'b', 'c')}
+        calls['done'] = lambda: 'done'
+
+        started = time.monotonic()
+        results = fan_out(calls, timeout=0.2)
+
+        self.assertLess(time.monotonic() - started, 0.5)
+        self.assertEqual(results['done'], 'done')
+        self.assertEqual(results['a'], {'error': TIMEOUT_MESSAGE})
+
+    def test_as_completed_yields_timeouts_last(self):
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        results = list(fan_out_as_completed({'hung': release.wait, 'ok': lambda: 1}, timeout=0.2))
+
+        self.assertEqual(results, [('ok', 1), ('hung', {'error': TIMEOUT_MESSAGE})])
+
+
+class SingleFlightTest(unittest.TestCase):
+
+    def run_concurrently(self, flight, func, callers=5):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(flight.do('key', func)))
+            for _ in range(callers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_callers_share_one_execution(self):
+        calls = []
+
+        def fetch():
+            calls.append(1)
+            time.sleep(0.1)
+            return {'details': {'owner': 'a'}}
+
+        results = self.run_concurrently(SingleFlight(), fetch)
+
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(len(results), 5)
+        self.assertTrue(all(result == {'details': {'owner': 'a'}} for result in results))
+
+    def test_waiters_get_independent_copies(self):
+        def fetch():
+            time.sleep(0.1)
+            return {'details': {'owner': 'a'}}
+
+        results = self.run_concurrently(SingleFlight(), fetch)
+
+        self.assertEqual(len({id(result['details']) for result in results}), len(results))
+        results[0]['details']['owner'] = 'mutated'
+        self.assertEqual(results[1]['details']['owner'], 'a')
+
+    def test_exception_reaches_every_caller(self):
+        errors = []
+        flight = SingleFlight()
+
+        def fetch():
+            time.sleep(0.1)
+            raise RuntimeError('boom')
+
+        def caller():
+            try:
+                flight.do('key', fetch)
+            except RuntimeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=caller) for _ in range(3)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(errors), 3)
+
+    def test_later_calls_run_again(self):
+        flight = SingleFlight()
+        calls = []
+
+        flight.do('key', calls.append, 1)
+        flight.do('key', calls.append, 2)
+
+        self.assertEqual(calls, [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
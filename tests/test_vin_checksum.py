@@ -0,0 +1,57 @@
+"""Tests for VIN check digit validation."""
+
+import unittest
+
+from src.public_record.apis.vehicle_records import _normalize_vin
+from src.public_record.apis.vin_checksum import has_check_digit, vin_check
+from src.public_record.base import InvalidInputError
+
+
+class VinCheckTest(unittest.TestCase):
+
+    def test_valid_check_digits(self):
+        for vin in ('1HGBH41JXMN109186', '11111111111111111', '1M8GDM9AXKP042788'):
+            with self.subTest(vin=vin):
+                self.assertTrue(vin_check(vin))
+
+    def test_lower_case_is_accepted(self):
+        self.assertTrue(vin_check('1hgbh41jxmn109186'))
+
+    def test_wrong_check_digit(self):
+        self.assertFalse(vin_check('1HGBH41J1MN109186'))
+
+    def test_wrong_length(self):
+        self.assertFalse(vin_check('1HGBH41JXMN10918'))
+        self.assertFalse(vin_check('1HGBH41JXMN1091866'))
+
+    def test_letters_vins_never_use(self):
+        self.assertFalse(vin_check('1HGBH41JXMN10918O'))
+
+    def test_only_north_american_vins_have_a_check_digit(self):
+        self.assertTrue(has_check_digit('1HGBH41JXMN109186'))
+        self.assertTrue(has_check_digit('5YJSA1E26HF000001'))
+        self.assertFalse(has_check_digit('WVWZZZ1JZXW000001'))
+        self.assertFalse(has_check_digit('JH4KA7561PC008269'))
+        self.assertFalse(has_check_digit(''))
+
+
+class NormalizeVinTest(unittest.TestCase):
+
+    def test_upper_cases_valid_vin(self):
+        self.assertEqual(_normalize_vin('1hgbh41jxmn109186'), '1HGBH41JXMN109186')
+
+    def test_accepts_iso_vin_without_check_digit(self):
+        self.assertEqual(_normalize_vin('WVWZZZ1JZXW000001'), 'WVWZZZ1JZXW000001')
+
+    def test_rejects_north_american_vin_with_bad_check_digit(self):
+        with self.assertRaises(InvalidInputError):
+            _normalize_vin('1HGBH41J1MN109186')
+
+    def test_rejects_malformed_vin(self):
+        for vin in ('BADVIN', 'WVWZZZ1JZXW00000I', ''):
+            with self.subTest(vin=vin), self.assertRaises(InvalidInputError):
+                _normalize_vin(vin)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,9 @@
+"""WSGI entry point for production servers.
+
+Example:
+    gunicorn -w 4 -k gthread --threads 16 --worker-tmp-dir /dev/shm wsgi:app
+"""
+
+from app import app
+
+__all__ = ['app']